@@ -13,7 +13,7 @@ def add_point():
 
 
 def clear():
-    graph.draw_axes()
+    graph.clear_series()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,41 @@
+import math
+import tkinter as tk
+import tk_tools
+
+
+def add_sample():
+    global t
+
+    t += 0.02
+    sine.append(t, 1.0 + math.sin(t))
+    cosine.append(t, 1.0 + math.cos(t))
+
+    root.after(20, add_sample)
+
+
+if __name__ == '__main__':
+
+    root = tk.Tk()
+
+    # a strip chart showing the last 10 seconds of data
+    graph = tk_tools.Graph(
+        parent=root,
+        x_min=0.0,
+        x_max=10.0,
+        y_min=0.0,
+        y_max=2.0,
+        x_tick=1.0,
+        y_tick=0.2,
+        window=10.0,
+        width=500,
+        height=400
+    )
+    graph.grid(row=0, column=0)
+
+    sine = graph.add_series('sine', color='blue')
+    cosine = graph.add_series('cosine', color='red')
+
+    t = 0.0
+    root.after(20, add_sample)
+
+    root.mainloop()
@@ -0,0 +1,58 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import BarChart
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def bar_chart(root):
+    bar_chart_widget = BarChart(root, count=4, y_min=0.0, y_max=100.0, y_tick=20.0)
+    bar_chart_widget.grid()
+
+    yield bar_chart_widget
+
+
+def test_creation(root):
+    BarChart(root, 10, 0.0, 1.0, 0.1)
+
+
+def test_invalid_count(root):
+    with pytest.raises(ValueError):
+        BarChart(root, 0, 0.0, 1.0, 0.1)
+
+
+def test_one_item_per_bar(bar_chart):
+    assert len(bar_chart.canvas.find_withtag("bar")) == 4
+
+    bar_chart.set_values([10, 20, 30, 40])
+    assert len(bar_chart.canvas.find_withtag("bar")) == 4
+
+
+def test_set_values(bar_chart):
+    bar_chart.set_values([10, 20, 30, 40])
+
+    x0, y0, x1, y1 = bar_chart.canvas.coords(bar_chart._bars[3])
+    assert (x0 + x1) / 2 == pytest.approx(
+        bar_chart.plot_point(3.5, 0, visible=False)[0]
+    )
+    assert y0 == pytest.approx(bar_chart.plot_point(0, 40, visible=False)[1])
+    assert y1 == pytest.approx(bar_chart.plot_point(0, 0, visible=False)[1])
+
+
+def test_set_values_wrong_length(bar_chart):
+    with pytest.raises(ValueError):
+        bar_chart.set_values([1, 2])
+
+
+def test_unchanged_bars_untouched(bar_chart):
+    bar_chart.set_values([10, 20, 30, 40])
+    coords = bar_chart.canvas.coords
+    calls = []
+    bar_chart.canvas.coords = lambda *args: calls.append(args) or coords(*args)
+
+    bar_chart.set_values([10, 20, 30, 45])
+
+    assert len(calls) == 1
@@ -0,0 +1,60 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import Gauge
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def gauge(root):
+    gauge_widget = Gauge(root, max_value=100.0, label="speed", unit="km/h")
+    gauge_widget.grid()
+
+    yield gauge_widget
+
+
+def test_creation(root):
+    Gauge(root)
+
+
+def test_set_value(gauge):
+    gauge.set_value(50)
+
+    assert gauge._needle_value == 50
+
+
+def test_animate(root):
+    gauge = Gauge(root, animate=True, duration=0.05, easing="linear")
+
+    gauge.set_value(25)
+    gauge.set_value(50)
+
+    assert gauge._needle_value == 0
+
+    while gauge._shown != 50:
+        root.after(10)
+        root.update()
+
+    assert gauge._needle_value == 50
+
+
+def test_items_persist(gauge):
+    items = gauge._canvas.find_all()
+
+    gauge.set_value(50)
+    gauge.set_value(150)
+    gauge.set_value(75)
+
+    assert gauge._canvas.find_all() == items
+
+
+def test_readout(gauge):
+    gauge.set_value(50)
+    assert gauge._canvas.itemcget(gauge._readout_item, "text") == "50km/h"
+    assert gauge._canvas.itemcget(gauge._readout_box, "fill") == "black"
+
+    gauge.set_value(150)
+    assert gauge._canvas.itemcget(gauge._readout_box, "fill") == "red"
+    assert gauge._needle_value == 50
@@ -0,0 +1,743 @@
+import array
+import math
+import random
+import time
+import tkinter as tk
+
+import pytest
+
+from tk_tools import Graph
+from tk_tools.canvas import (
+    _decimate_lttb,
+    _decimate_minmax,
+    _decimate_minmax_arrays,
+    _GridIndex,
+    _map_file,
+    _read_binary,
+    _read_csv,
+    _RunningExtrema,
+    _StreamStats,
+    _MinMaxPyramid,
+    _nice_tick,
+    _tick_layout,
+)
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def graph(root):
+    graph_widget = Graph(root, 0, 10, 0, 10, 1, 1)
+    graph_widget.grid()
+
+    yield graph_widget
+
+
+def test_creation(root):
+    Graph(root, 0, 10, 0, 10, 1, 1)
+
+
+def test_plot_line_single_item(graph):
+    series = graph.plot_line([(x / 1000, x / 1000) for x in range(10000)])
+
+    assert len(graph.canvas.find_withtag(series.tag)) == 1
+
+
+def test_plot_line_chunked(graph):
+    points = [(x / 10000, x / 10000) for x in range(25000)]
+    series = graph.plot_line(points, decimation=None)
+
+    items = graph.canvas.find_withtag(series.tag)
+    assert len(items) == 3
+
+    # chunks share their boundary point
+    first = graph.canvas.coords(items[0])
+    second = graph.canvas.coords(items[1])
+    assert first[-2:] == second[:2]
+
+
+def test_plot_line_point_visibility(graph):
+    series = graph.plot_line([(1, 1), (2, 2), (3, 3)], point_visibility=True)
+
+    assert len(graph.canvas.find_withtag(series.tag)) == 4
+
+
+def test_series_delete(graph):
+    series = graph.plot_line([(1, 1), (2, 2)])
+    series.delete()
+
+    assert graph.canvas.find_withtag(series.tag) == ()
+
+
+def test_add_series(graph):
+    series = graph.add_series("sensor", maxlen=100)
+
+    assert graph.get_series("sensor") is series
+    assert len(series) == 0
+
+
+def test_add_series_duplicate(graph):
+    graph.add_series("sensor")
+
+    with pytest.raises(ValueError):
+        graph.add_series("sensor")
+
+
+def test_series_append_in_place(graph):
+    series = graph.add_series("sensor", maxlen=100)
+    series.append(0, 0)
+    series.append(1, 1)
+
+    items = graph.canvas.find_withtag(series.tag)
+    assert len(items) == 1
+
+    series.extend([(2, 2), (3, 3)])
+    assert graph.canvas.find_withtag(series.tag) == items
+    assert len(graph.canvas.coords(items[0])) == 8
+
+
+def test_series_ring_buffer(graph):
+    series = graph.add_series("sensor", maxlen=50)
+
+    for i in range(1000):
+        series.append(i / 100, 5)
+
+    assert len(series) == 50
+    assert series.points[0] == (9.5, 5)
+    assert len(graph.canvas.find_withtag(series.tag)) == 1
+
+
+def test_decimate_minmax_keeps_spikes():
+    points = [(x / 1000, 0.0) for x in range(100000)]
+    points[51234] = (51.234, 10.0)
+    points[76543] = (76.543, -10.0)
+
+    decimated = _decimate_minmax(points, 0, 100, 200)
+
+    assert len(decimated) <= 2 * 202
+    assert (51.234, 10.0) in decimated
+    assert (76.543, -10.0) in decimated
+    assert decimated[0] == points[0]
+    assert [p[0] for p in decimated] == sorted(p[0] for p in decimated)
+
+
+def test_decimate_minmax_small_series_unchanged():
+    points = [(x, x) for x in range(10)]
+
+    assert _decimate_minmax(points, 0, 10, 100) == points
+
+
+def test_decimate_lttb():
+    points = [(x, (x % 100) * (1 if x % 2 else -1)) for x in range(10000)]
+
+    decimated = _decimate_lttb(points, 500)
+
+    assert len(decimated) == 500
+    assert decimated[0] == points[0]
+    assert decimated[-1] == points[-1]
+
+
+def test_plot_line_decimated(graph):
+    points = [(x / 100000, 5.0) for x in range(1000000)]
+    series = graph.plot_line(points)
+
+    coords = graph.canvas.coords(graph.canvas.find_withtag(series.tag)[0])
+    assert len(coords) <= 4 * (graph.w - 100 + 2)
+
+
+def test_pyramid_window_keeps_spikes():
+    points = [(x, 0.0) for x in range(100000)]
+    points[12345] = (12345, 5.0)
+
+    window = _MinMaxPyramid(points).window(10000, 20000, 100)
+
+    assert len(window) <= 2 * 102
+    assert (12345, 5.0) in window
+    assert window[0][0] < 10000
+    assert window[-1][0] > 20000
+
+
+def test_pyramid_window_sorted_by_x():
+    points = [(x, (x * 7919) % 101) for x in range(100000)]
+
+    # the window starts and ends part way through buckets of every level
+    window = _MinMaxPyramid(points).window(12345.5, 54321.5, 100)
+    xs = [x for x, _ in window]
+
+    assert xs == sorted(xs)
+    assert xs[0] == 12345
+    assert xs[-1] == 54322
+
+
+def test_pyramid_incremental_matches_rebuild():
+    points = [(x, (x * 7919) % 101) for x in range(5000)]
+
+    incremental = []
+    pyramid = _MinMaxPyramid(incremental)
+    for point in points:
+        incremental.append(point)
+        pyramid.add(len(incremental) - 1)
+
+    assert pyramid._levels == _MinMaxPyramid(points)._levels
+
+
+def test_series_lttb_differs_from_minmax(graph):
+    points = [(x / 10000, 5 + 4 * math.sin(x / 37)) for x in range(100000)]
+
+    lttb = graph.add_series("lttb", decimation="lttb")
+    lttb.extend(points)
+    minmax = graph.add_series("minmax", decimation="minmax")
+    minmax.extend(points)
+
+    assert lttb._coords() != minmax._coords()
+
+
+def test_series_unsorted_drops_pyramid(graph):
+    series = graph.add_series()
+    series.extend([(1, 1), (0, 0)])
+
+    assert series._pyramid is None
+
+
+def test_clear_series_keeps_axes(graph):
+    axes = graph.canvas.find_withtag("axes")
+    graph.plot_line([(1, 1), (2, 2)])
+    graph.plot_point(3, 3)
+
+    graph.clear_series()
+
+    assert graph.canvas.find_withtag("series") == ()
+    assert graph.canvas.find_withtag("axes") == axes
+
+
+def test_append_after_clear_series(graph):
+    series = graph.add_series("sensor", maxlen=100)
+    series.append(1, 1)
+
+    graph.clear_series()
+
+    assert len(series) == 0
+    with pytest.raises(ValueError):
+        series.append(2, 2)
+
+
+def test_draw_axes_unchanged_range(graph):
+    axes = graph.canvas.find_withtag("axes")
+    graph.plot_line([(1, 1), (2, 2)])
+
+    graph.draw_axes()
+
+    assert graph.canvas.find_withtag("series") == ()
+    assert graph.canvas.find_withtag("axes") == axes
+
+
+def test_axes_redrawn_on_resize(graph):
+    axes = graph.canvas.find_withtag("axes")
+
+    graph.canvas.configure(width=500)
+    graph.draw_axes()
+
+    assert graph.w == 500
+    assert graph.canvas.find_withtag("axes") != axes
+
+
+def test_tick_layout():
+    layout = _tick_layout(-1.0, 1.0, 0.2, 280)
+
+    assert len(layout) == 11
+    assert layout[0] == (0.0, "-1.0")
+    assert layout[5][1] == "0.0"
+    assert layout[-1][1] == "1.0"
+    assert layout[-1][0] == pytest.approx(280)
+
+
+def test_tick_layout_aligned_to_tick():
+    layout = _tick_layout(0.05, 1.0, 0.25, 100)
+
+    assert [label for _, label in layout] == ["0.25", "0.50", "0.75", "1.00"]
+
+
+def test_tick_layout_cached():
+    assert _tick_layout(0, 10, 1, 280) is _tick_layout(0, 10, 1, 280)
+
+
+def test_set_xlim_transforms_series(graph):
+    series = graph.plot_line([(1, 1), (2, 4), (3, 9)])
+    item = graph.canvas.find_withtag(series.tag)[0]
+
+    graph.set_xlim(1, 6)
+    graph.set_ylim(-2, 12, 2)
+
+    assert graph.canvas.coords(item) == pytest.approx(graph._to_canvas(series.points))
+
+
+def test_pan(graph):
+    series = graph.plot_line([(1, 1), (2, 4), (3, 9)])
+    item = graph.canvas.find_withtag(series.tag)[0]
+
+    graph.pan(dx=1.0, dy=-1.0)
+
+    assert (graph.x_min, graph.x_max) == (1.0, 11.0)
+    assert (graph.y_min, graph.y_max) == (-1.0, 9.0)
+    assert graph.canvas.coords(item) == pytest.approx(graph._to_canvas(series.points))
+
+
+def test_set_xlim_invalid(graph):
+    with pytest.raises(ValueError):
+        graph.set_xlim(5, 5)
+
+
+def test_strip_chart(root):
+    graph = Graph(root, 0, 10, 0, 10, 1, 1, window=10)
+    graph.grid()
+    series = graph.add_series("sensor")
+
+    for i in range(2000):
+        series.append(i / 100, 5)
+    root.update()
+
+    assert (graph.x_min, graph.x_max) == pytest.approx((9.99, 19.99))
+    assert len(series) == 1001
+    assert len(graph.canvas.find_withtag(series.tag)) == 1
+
+
+def test_strip_chart_invalid_window(root):
+    with pytest.raises(ValueError):
+        Graph(root, 0, 10, 0, 10, 1, 1, window=0)
+
+
+def test_decimate_minmax_arrays_matches_lists():
+    np = pytest.importorskip("numpy")
+
+    x = np.linspace(0, 100, 100000)
+    y = np.sin(x * 17)
+
+    xd, yd = _decimate_minmax_arrays(x, y, 0, 100, 200)
+    points = _decimate_minmax(list(zip(x.tolist(), y.tolist())), 0, 100, 200)
+
+    assert list(zip(xd.tolist(), yd.tolist())) == points
+
+
+def test_plot_line_numpy(graph):
+    np = pytest.importorskip("numpy")
+
+    x = np.linspace(0, 10, 1000000)
+    y = np.full_like(x, 5.0)
+    y[500000] = 9.5
+
+    series = graph.plot_line(x=x, y=y)
+    coords = graph.canvas.coords(graph.canvas.find_withtag(series.tag)[0])
+
+    assert len(coords) <= 4 * (graph.w - 100 + 2)
+    assert min(coords[1::2]) == pytest.approx(graph.plot_point(0, 9.5, False)[1])
+
+
+def test_plot_line_numpy_columns(graph):
+    np = pytest.importorskip("numpy")
+
+    series = graph.plot_line(np.array([[1, 1], [2, 4], [3, 9]]))
+    coords = graph.canvas.coords(graph.canvas.find_withtag(series.tag)[0])
+
+    assert coords == pytest.approx(graph._to_canvas([(1, 1), (2, 4), (3, 9)]))
+
+
+def test_plot_line_array_array(graph):
+    series = graph.plot_line(
+        x=array.array("d", [1, 2, 3]), y=array.array("d", [1, 4, 9])
+    )
+    coords = graph.canvas.coords(graph.canvas.find_withtag(series.tag)[0])
+
+    assert coords == pytest.approx(graph._to_canvas([(1, 1), (2, 4), (3, 9)]))
+
+    series.append(4, 16)
+    assert len(series) == 4
+
+
+def test_grid_index_nearest():
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 100)) for _ in range(5000)]
+    grid = _GridIndex(points, 28.0, 1.7)
+
+    for _ in range(100):
+        x, y = rng.uniform(-2, 12), rng.uniform(-20, 120)
+        expected = min(
+            points, key=lambda p: math.hypot((p[0] - x) * 28.0, (p[1] - y) * 1.7)
+        )
+
+        assert grid.nearest(x, y, 28.0, 1.7) == expected
+
+
+def test_series_nearest_sorted(graph):
+    series = graph.plot_line([(x / 10, x % 7) for x in range(100)])
+
+    assert series.nearest(3.12) == (3.1, 3)
+    assert series.nearest(-5) == (0.0, 0)
+    assert series.nearest(50) == (9.9, 1)
+
+
+def test_series_nearest_scatter(graph):
+    series = graph.plot_line([(5, 5), (1, 9), (9, 1)])
+
+    assert series.nearest(2, 8) == (1, 9)
+
+    with pytest.raises(ValueError):
+        series.nearest(2)
+
+
+def test_graph_nearest(graph):
+    graph.plot_line([(1, 1), (2, 2)], name="low")
+    graph.plot_line([(1, 8), (2, 9)], name="high")
+
+    series, point = graph.nearest(1.9, 8)
+
+    assert series.name == "high"
+    assert point == (2, 9)
+
+
+def test_crosshair(root, graph):
+    graph.plot_line([(1, 1), (2, 2)])
+    graph.show_crosshair()
+
+    px, py = graph.plot_point(2, 2, visible=False)
+    graph._pointer = (px, py)
+    graph._update_crosshair()
+
+    readout = graph._crosshair[2]
+    assert graph.canvas.itemcget(readout, "text") == "(2, 2)"
+    assert graph.canvas.itemcget(readout, "state") == "normal"
+
+    graph.hide_crosshair()
+    assert graph.canvas.find_withtag("crosshair") == ()
+
+
+def test_crosshair_keeps_user_bindings(root, graph):
+    moves = []
+    graph.canvas.bind("<Motion>", moves.append)
+
+    graph.show_crosshair()
+    graph.hide_crosshair()
+
+    graph.canvas.event_generate("<Motion>", x=10, y=10)
+    assert len(moves) == 1
+
+
+def test_plot_scatter_single_item(graph):
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(100000)]
+
+    series = graph.plot_scatter(points)
+
+    assert len(graph.canvas.find_withtag(series.tag)) == 1
+    assert sum(series.counts) == 100000
+
+
+def test_plot_scatter_density(graph):
+    series = graph.plot_scatter([(5, 5)] * 10 + [(2, 2)], density=True)
+
+    assert sorted(series.counts)[-2:] == [1, 10]
+    assert len(series.counts) == int(graph.w - 100) * int(graph.h - 100)
+
+
+def test_plot_scatter_density_top_level(graph):
+    # log1p(16) * 255 / log1p(16) rounds up past the last palette level
+    series = graph.plot_scatter([(5, 5)] * 16, density=True)
+
+    assert max(series.counts) == 16
+
+
+def test_plot_scatter_two_series(graph):
+    first = graph.plot_scatter([(5, 5)], color="red")
+    second = graph.plot_scatter([(2, 2)], color="blue")
+
+    # empty pixels are transparent, so neither image hides the other
+    for series, point in ((first, (5, 5)), (second, (2, 2))):
+        px, py = graph.plot_point(*point, visible=False)
+        x, y = int(px - graph._x0), int(py - graph._y0)
+        assert not series._image.transparency_get(x, y)
+        assert first._image.transparency_get(x, y) != (series is first)
+        assert second._image.transparency_get(x, y) != (series is second)
+
+
+def test_plot_scatter_keeps_frame_visible(graph):
+    series = graph.plot_scatter([(5, 5)])
+    items = graph.canvas.find_all()
+
+    frame = graph.canvas.find_withtag("frame")[0]
+    assert items.index(frame) > items.index(series._items[0])
+
+
+def test_masks_cover_series_outside_plot_area(graph):
+    graph.plot_line([(x / 10, x / 20) for x in range(100)])
+    graph.set_xlim(2, 5)
+    items = graph.canvas.find_all()
+
+    masks = graph.canvas.find_withtag("mask")
+    assert len(masks) == 4
+    lines = graph.canvas.find_withtag("series")
+    assert min(map(items.index, masks)) > max(map(items.index, lines))
+
+
+def _wait_for_render(root, series):
+    for _ in range(500):
+        root.update()
+        if not series._pending:
+            return
+        time.sleep(0.01)
+
+
+def test_threaded_render(root):
+    graph = Graph(root, 0, 10, 0, 10, 1, 1, threaded=True)
+    graph.grid()
+    points = [(x / 1000, x / 1000) for x in range(10000)]
+
+    series = graph.plot_line(points)
+    _wait_for_render(root, series)
+
+    item = graph.canvas.find_withtag(series.tag)[0]
+    assert graph.canvas.coords(item) == pytest.approx(graph._to_canvas(series.points))
+
+
+def test_threaded_render_drops_stale(root):
+    graph = Graph(root, 0, 10, 0, 10, 1, 1, threaded=True)
+    graph.grid()
+    series = graph.add_series("sensor", decimation=None)
+
+    series.extend([(0, 0), (10, 10)])
+    series.clear()
+    series.extend([(0, 5), (10, 5)])
+    graph.set_xlim(0, 5)
+    _wait_for_render(root, series)
+
+    item = graph.canvas.find_withtag(series.tag)[0]
+    assert series._generation == 4
+    assert graph.canvas.coords(item) == pytest.approx(graph._to_canvas(series.points))
+
+
+def _write_values(path, typecode, values):
+    with open(path, "wb") as f:
+        array.array(typecode, values).tofile(f)
+
+    return str(path)
+
+
+def test_map_file(tmp_path):
+    path = _write_values(tmp_path / "values.f64", "d", [1.0, 2.0, 3.0])
+
+    assert list(_map_file(path, "float64")) == [1.0, 2.0, 3.0]
+    assert list(_map_file(path, "float64", offset=8)) == [2.0, 3.0]
+
+
+def test_plot_file(tmp_path, graph):
+    values = []
+    for x in range(100000):
+        values.extend((x / 1000, math.sin(x / 100)))
+    path = _write_values(tmp_path / "capture.f32", "f", values)
+
+    series = graph.plot_file(path, dtype="float32")
+    assert len(series) == 100000
+
+    graph.set_xlim(2, 3)
+    item = graph.canvas.find_withtag(series.tag)[0]
+    assert len(graph.canvas.coords(item)) < 2 * len(series)
+
+    with pytest.raises(ValueError):
+        series.append(101, 0)
+
+
+def test_plot_file_separate_x(tmp_path, graph):
+    x_path = _write_values(tmp_path / "x.f64", "d", [0, 1, 2, 3])
+    y_path = _write_values(tmp_path / "y.f64", "d", [0, 1, 4, 9])
+
+    series = graph.plot_file(y_path, x_path=x_path)
+
+    item = graph.canvas.find_withtag(series.tag)[0]
+    expected = graph._to_canvas([(0, 0), (1, 1), (2, 4), (3, 9)])
+    assert graph.canvas.coords(item) == pytest.approx(expected)
+
+
+def test_read_csv_chunks(tmp_path):
+    path = tmp_path / "log.csv"
+    path.write_text("t;v\n" + "".join("{};{}\n".format(i, 2 * i) for i in range(25)))
+
+    with open(path, "rb") as f:
+        chunks = list(_read_csv(f, 1, 0, ";", 1, 10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0][:2] == [(0.0, 0.0), (2.0, 1.0)]
+
+
+def test_read_binary_chunks(tmp_path):
+    path = _write_values(tmp_path / "capture.f64", "d", range(50))
+
+    with open(path, "rb") as f:
+        chunks = list(_read_binary(f, "float64", 10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[-1][-1] == (48.0, 49.0)
+
+
+def _wait_for_load(root, loader):
+    for _ in range(500):
+        root.update()
+        if loader.finished:
+            return
+        time.sleep(0.01)
+
+
+def test_load_csv(tmp_path, root, graph):
+    path = tmp_path / "log.csv"
+    path.write_text("".join("{},{}\n".format(i / 100, i % 10) for i in range(1000)))
+    progress, done = [], []
+
+    loader = graph.load_csv(
+        str(path), chunk_size=100, progress=progress.append, done=done.append
+    )
+    _wait_for_load(root, loader)
+
+    assert len(loader.series) == 1000
+    assert progress[-1] == 1.0
+    assert done == [loader]
+    assert not loader.cancelled
+
+
+def test_load_cancel(tmp_path, root, graph):
+    path = _write_values(tmp_path / "capture.f64", "d", range(200000))
+
+    loader = graph.load_binary(path, chunk_size=10)
+    loader.cancel()
+    count = len(loader.series)
+    root.update()
+
+    assert loader.cancelled and loader.finished
+    assert len(loader.series) == count < 100000
+
+
+def test_destroy_cancels_loaders(tmp_path, root):
+    path = _write_values(tmp_path / "capture.f64", "d", range(200000))
+    graph = Graph(root, 0, 10, 0, 10, 1, 1)
+
+    loader = graph.load_binary(path, chunk_size=10)
+    graph.destroy()
+    loader._worker.join(timeout=1.0)
+
+    assert loader.cancelled and loader.finished
+    assert not loader._worker.is_alive()
+
+
+def test_running_extrema_sliding():
+    rng = random.Random(0)
+    extrema = _RunningExtrema(sliding=True)
+    window = []
+
+    for _ in range(2000):
+        if window and rng.random() < 0.4:
+            count = rng.randint(1, len(window))
+            del window[:count]
+            extrema.drop(count)
+        else:
+            values = [rng.uniform(-1, 1) for _ in range(rng.randint(1, 5))]
+            window.extend(values)
+            extrema.push(values)
+
+        expected = (min(window), max(window)) if window else (None, None)
+        assert (extrema.min, extrema.max) == expected
+        assert extrema.count == len(window)
+
+
+def test_running_extrema_growing():
+    extrema = _RunningExtrema(sliding=False)
+    extrema.push([3, 1, 2])
+    extrema.push([5])
+
+    assert (extrema.min, extrema.max, extrema.count) == (1, 5, 4)
+
+
+def test_nice_tick():
+    assert _nice_tick(10, 10) == 1
+    assert _nice_tick(9, 5) == 2
+    assert _nice_tick(0.3, 10) == pytest.approx(0.05)
+
+
+def test_autoscale(root):
+    graph = Graph(root, 0, 10, 0, 1, 1, 0.1, autoscale=True)
+    graph.grid()
+    series = graph.add_series("sensor", maxlen=100)
+
+    series.append(0, 50)
+    series.append(1, 60)
+    assert graph.y_min < 50 and graph.y_max > 60
+
+    # small changes within the range leave the axes alone
+    y_range = graph.y_min, graph.y_max
+    series.append(2, 55)
+    assert (graph.y_min, graph.y_max) == y_range
+
+
+def test_autoscale_ring_buffer(root):
+    graph = Graph(root, 0, 10, 0, 1, 1, 0.1, autoscale=True)
+    graph.grid()
+    series = graph.add_series("sensor", maxlen=10)
+
+    series.extend([(i, 1000) for i in range(10)])
+    series.extend([(i, 1) for i in range(10, 20)])
+
+    assert series._y_range() == (1, 1)
+    assert graph.y_max < 1000
+
+
+def test_autoscale_flat_data(root):
+    graph = Graph(root, 0, 10, 0, 1, 1, 0.1, autoscale=True, autoscale_margin=0.0)
+    graph.grid()
+
+    graph.add_series("flat").extend([(0, 5), (1, 5)])
+
+    assert graph.y_min < 5 < graph.y_max
+
+
+def test_autoscale_negative_margin(root):
+    with pytest.raises(ValueError):
+        Graph(root, 0, 10, 0, 1, 1, 0.1, autoscale=True, autoscale_margin=-0.1)
+
+
+def test_stream_stats_welford():
+    rng = random.Random(0)
+    values = [rng.gauss(5, 2) for _ in range(1000)]
+
+    stats = _StreamStats()
+    stats.push(enumerate(values))
+
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / len(values)
+    assert stats.mean == pytest.approx(mean)
+    assert stats.variance == pytest.approx(variance)
+
+
+def test_stream_stats_weighted_envelope():
+    stats = _StreamStats(alpha=0.5, envelope=2)
+    stats.push([(0, 1), (1, 3), (2, 2)])
+
+    assert [point[1] for point in stats.points] == [1, 2, 2]
+    assert [point[3:] for point in stats.points] == [(1, 1), (1, 3), (2, 3)]
+
+
+def test_stream_stats_bounded():
+    stats = _StreamStats(bounded=True, maxlen=3)
+    stats.push((i, i) for i in range(10))
+
+    assert [point[0] for point in stats.points] == [7, 8, 9]
+    assert stats.mean == pytest.approx(4.5)
+
+
+def test_show_stats(graph):
+    series = graph.add_series("sensor", maxlen=100)
+    series.show_stats(deviations=2.0, envelope=10)
+    for i in range(200):
+        series.append(i / 20, 5 + math.sin(i / 10))
+
+    assert set(series._stats_items) == {"band", "envelope", "mean"}
+    mean = graph.canvas.coords(series._stats_items["mean"])
+    assert len(mean) == 2 * 100
+    assert graph.canvas.type(series._stats_items["band"]) == "polygon"
+
+    series.hide_stats()
+    assert len(graph.canvas.find_withtag(series.tag)) == 1
@@ -0,0 +1,54 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import Histogram
+from tk_tools.canvas import _bin_counts
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def histogram(root):
+    histogram_widget = Histogram(root, bins=5, x_min=0.0, x_max=5.0, y_max=10.0)
+    histogram_widget.grid()
+
+    yield histogram_widget
+
+
+def test_creation(root):
+    Histogram(root, bins=256, x_min=0.0, x_max=256.0, y_max=1000.0)
+
+
+def test_bin_counts():
+    samples = [0, 0.5, 1, 2, 3, 4, 5, -1, 6]
+
+    assert _bin_counts(samples, 0.0, 5.0, 5) == [2, 1, 1, 1, 2]
+
+
+def test_set_data(histogram):
+    histogram.set_data([0, 0.5, 1, 2, 3, 4, 5])
+    assert histogram.counts == [2, 1, 1, 1, 2]
+
+    histogram.set_data([4.5])
+    assert histogram.counts == [0, 0, 0, 0, 1]
+
+
+def test_add_data(histogram):
+    histogram.add_data([1.5])
+    histogram.add_data([1.5, 2.5])
+
+    assert histogram.counts == [0, 2, 1, 0, 0]
+
+
+def test_set_range(histogram):
+    histogram.set_data([1.5])
+    bars = list(histogram._bars)
+
+    histogram.set_range(0.0, 5.0)
+    assert histogram.counts == [0, 1, 0, 0, 0]
+
+    histogram.set_range(0.0, 10.0, bins=10)
+    assert histogram.counts == [0] * 10
+    assert histogram._bars[:5] == bars
+    assert len(histogram.canvas.find_withtag("bar")) == 10
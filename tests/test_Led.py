@@ -0,0 +1,46 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import Led
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def led(root):
+    led_widget = Led(root, size=50)
+    led_widget.grid()
+
+    yield led_widget
+
+
+def test_creation(root):
+    Led(root)
+
+
+def test_state_changes_reuse_item(led):
+    items = led._canvas.find_all()
+
+    led.to_green(on=True)
+    led.to_red()
+    led.to_yellow(on=True)
+
+    assert led._canvas.find_all() == items
+
+
+def test_images_shared(root):
+    leds = [Led(root, size=50) for _ in range(10)]
+    for led in leds:
+        led.to_green(on=True)
+
+    assert len({id(led._image) for led in leds}) == 1
+
+
+def test_click_callback(root):
+    states = []
+    led = Led(root, size=50, on_click_callback=states.append)
+
+    led.to_green(on=True)
+
+    assert states[-1] is True
@@ -0,0 +1,91 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import MultiGraph
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def multigraph(root):
+    multigraph_widget = MultiGraph(
+        root,
+        x_min=0.0,
+        x_max=10.0,
+        x_tick=1.0,
+        panels=[(-1.0, 1.0, 0.5), (0.0, 100.0, 25.0)],
+        width=600,
+        height=400,
+    )
+    multigraph_widget.grid()
+
+    yield multigraph_widget
+
+
+def test_creation(root):
+    MultiGraph(root, 0.0, 10.0, 1.0, panels=[(0.0, 1.0, 0.2)])
+
+
+def test_no_panels(root):
+    with pytest.raises(ValueError):
+        MultiGraph(root, 0.0, 10.0, 1.0, panels=[])
+
+
+def test_panels_share_canvas(multigraph):
+    top, bottom = multigraph.panels
+
+    assert top.canvas is bottom.canvas is multigraph.canvas
+    assert top._y1 + multigraph.spacing == pytest.approx(bottom._y0)
+    assert top._x0 == bottom._x0 and top._x1 == bottom._x1
+
+
+def test_set_xlim_moves_all_panels(multigraph):
+    top, bottom = multigraph.panels
+    a = top.plot_line([(0.0, 0.0), (5.0, 1.0)])
+    b = bottom.plot_line([(0.0, 50.0), (5.0, 75.0)])
+
+    multigraph.set_xlim(2.0, 4.0)
+
+    assert top.x_min == bottom.x_min == 2.0
+    for panel, series in ((top, a), (bottom, b)):
+        item = multigraph.canvas.find_withtag(series.tag)[0]
+        coords = multigraph.canvas.coords(item)
+        assert coords == pytest.approx(panel._to_canvas(series.points))
+
+
+def test_panel_pan(multigraph):
+    top, bottom = multigraph.panels
+
+    bottom.pan(dx=1.0, dy=10.0)
+
+    assert top.x_min == bottom.x_min == 1.0
+    assert bottom.y_min == 10.0
+    assert top.y_min == -1.0
+
+
+def test_clear_series(multigraph):
+    top, bottom = multigraph.panels
+    top.plot_line([(0.0, 0.0), (5.0, 1.0)])
+    bottom.plot_line([(0.0, 50.0), (5.0, 75.0)])
+
+    top.clear_series()
+    assert bottom._series
+
+    multigraph.clear_series()
+    assert not bottom._series
+
+
+def test_panel_crosshairs(multigraph):
+    top, bottom = multigraph.panels
+
+    top.show_crosshair()
+    bottom.show_crosshair()
+    top_motion = top._crosshair_bindings[0][1]
+    bottom_motion = bottom._crosshair_bindings[0][1]
+
+    top.hide_crosshair()
+
+    script = multigraph.canvas.bind("<Motion>")
+    assert top_motion not in script
+    assert bottom_motion in script
@@ -0,0 +1,102 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import RotaryScale
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def rotary_scale(root):
+    rotary_scale_widget = RotaryScale(root, max_value=100.0, size=100, unit="km/h")
+    rotary_scale_widget.grid()
+
+    yield rotary_scale_widget
+
+
+def test_creation(root):
+    RotaryScale(root)
+
+
+def test_items_persist(rotary_scale):
+    items = rotary_scale.canvas.find_all()
+
+    rotary_scale.set_value(50)
+    rotary_scale.set_value(75)
+
+    assert rotary_scale.canvas.find_all() == items
+    assert len(items) == 2
+
+
+def test_needle_moves(rotary_scale):
+    rotary_scale.set_value(0)
+    start = rotary_scale.canvas.coords(rotary_scale._needle)
+
+    rotary_scale.set_value(100)
+    end = rotary_scale.canvas.coords(rotary_scale._needle)
+
+    assert start[:2] == end[:2]
+    assert start[2:] != end[2:]
+
+
+def test_readout(rotary_scale):
+    rotary_scale.set_value(150)
+
+    assert rotary_scale.readout["text"] == "100.0km/h"
+
+
+def test_image_shared(root):
+    first = RotaryScale(root, size=100)
+    second = RotaryScale(root, size=100)
+    small = RotaryScale(root, size=50)
+
+    assert first.image is second.image
+    assert small.image is not first.image
+
+
+def test_animate_collapses_values(root):
+    rotary_scale = RotaryScale(root, animate=True, duration=0.05)
+    start = rotary_scale.canvas.coords(rotary_scale._needle)
+
+    for value in range(1, 50):
+        rotary_scale.set_value(value)
+
+    # nothing is drawn until the next frame
+    assert rotary_scale.canvas.coords(rotary_scale._needle) == start
+    assert rotary_scale.readout["text"] == "49"
+
+    while rotary_scale._shown != 49:
+        root.after(10)
+        root.update()
+
+    assert rotary_scale.canvas.coords(rotary_scale._needle) != start
+
+
+def test_animate_ends_on_target(root):
+    rotary_scale = RotaryScale(
+        root, animate=True, duration=0.05, easing=lambda t: t * 0.999
+    )
+    rotary_scale.set_value(10)
+    rotary_scale.set_value(30)
+
+    assert not rotary_scale._animate(rotary_scale._start + 0.05)
+    assert rotary_scale._shown == 30
+
+
+def test_bad_easing(root):
+    with pytest.raises(ValueError):
+        RotaryScale(root, easing="bounce")
+
+
+def test_point_at_clamps(rotary_scale):
+    assert rotary_scale.point_at(-1.0, 40) == rotary_scale.point_at(0.0, 40)
+    assert rotary_scale.point_at(2.0, 40) == rotary_scale.point_at(1.0, 40)
+
+
+def test_ticks(rotary_scale):
+    ticks = rotary_scale.ticks(4, 40, 50)
+
+    assert len(ticks) == 4
+    # the third tick of four is at the top of the scale
+    assert ticks[2] == pytest.approx((50.0, 10.0, 50.0, 0.0))
@@ -0,0 +1,71 @@
+import time
+import tkinter as tk
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tk_tools import SpectrumAnalyzer
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def analyzer(root):
+    analyzer_widget = SpectrumAnalyzer(root, sample_rate=48000, fft_size=2048)
+    analyzer_widget.grid()
+
+    yield analyzer_widget
+
+
+def _sine(frequency, count, sample_rate=48000):
+    return np.sin(2 * np.pi * frequency * np.arange(count) / sample_rate)
+
+
+def test_creation(root):
+    SpectrumAnalyzer(root, sample_rate=1000)
+
+
+def test_invalid_mode(root):
+    with pytest.raises(ValueError):
+        SpectrumAnalyzer(root, sample_rate=1000, mode="median")
+
+
+def test_compute_peak(analyzer):
+    levels = analyzer._compute(_sine(6000, 2048))
+
+    peak = int(np.argmax(levels))
+    assert analyzer.frequencies[peak] == pytest.approx(6000)
+    assert levels[peak] == pytest.approx(0.0, abs=0.1)
+
+
+def test_trace_updated(root, analyzer):
+    analyzer.add_samples(_sine(6000, 2048 * 4))
+
+    deadline = time.time() + 2.0
+    while analyzer._trace.points.__class__ is list and time.time() < deadline:
+        analyzer._poll()
+        time.sleep(0.01)
+
+    points = analyzer._trace.points
+    assert len(points) == 1025
+    assert len(analyzer.canvas.find_withtag(analyzer._trace.tag)) == 1
+
+
+def test_partial_frames_kept(analyzer):
+    analyzer.add_samples(np.zeros(3000))
+
+    assert len(analyzer._pending) == 3000 - 2048
+
+
+def test_trace_survives_clear_series(root, analyzer):
+    analyzer.clear_series()
+    analyzer.add_samples(_sine(6000, 2048 * 4))
+
+    deadline = time.time() + 2.0
+    while analyzer._trace.points.__class__ is list and time.time() < deadline:
+        analyzer._poll()
+        time.sleep(0.01)
+
+    assert len(analyzer._trace.points) == 1025
+    assert len(analyzer.canvas.find_withtag(analyzer._trace.tag)) == 1
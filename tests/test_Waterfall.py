@@ -0,0 +1,68 @@
+import tkinter as tk
+
+import pytest
+
+from tk_tools import Waterfall
+
+from tests.test_basic import root
+
+
+@pytest.fixture
+def waterfall(root):
+    waterfall_widget = Waterfall(root, bins=16, rows=8, min_value=0.0, max_value=1.0)
+    waterfall_widget.grid()
+
+    yield waterfall_widget
+
+
+def test_creation(root):
+    Waterfall(root, bins=1024)
+
+
+def test_lut(waterfall):
+    assert len(waterfall._lut) == 256
+    assert waterfall._lut[0] == "#000000"
+    assert waterfall._lut[-1] == "#ffffff"
+
+
+def _shown(waterfall, x, y):
+    # the color shown at (x, y), with the newest row at the top
+    return waterfall._image.get(x, (waterfall._head + y) % waterfall.rows)
+
+
+def test_add_row_scrolls(waterfall):
+    waterfall.add_row([1.0] * 16)
+    assert _shown(waterfall, 0, 0) == (255, 255, 255)
+
+    waterfall.add_row([0.0] * 16)
+    assert _shown(waterfall, 0, 0) == (0, 0, 0)
+    assert _shown(waterfall, 0, 1) == (255, 255, 255)
+
+
+def test_add_row_wraps(waterfall):
+    for _ in range(11):
+        waterfall.add_row([0.0] * 16)
+    waterfall.add_row([1.0] * 16)
+
+    top, bottom = waterfall._items
+    assert waterfall.canvas.coords(top)[1] == -waterfall._head
+    assert waterfall.canvas.coords(bottom)[1] == 8 - waterfall._head
+    assert _shown(waterfall, 0, 0) == (255, 255, 255)
+    assert _shown(waterfall, 0, 7) == (0, 0, 0)
+
+
+def test_add_row_clips_values(waterfall):
+    waterfall.add_row([-5.0] * 8 + [5.0] * 8)
+
+    assert _shown(waterfall, 0, 0) == (0, 0, 0)
+    assert _shown(waterfall, 15, 0) == (255, 255, 255)
+
+
+def test_add_row_wrong_length(waterfall):
+    with pytest.raises(ValueError):
+        waterfall.add_row([0.0] * 15)
+
+
+def test_set_range_invalid(waterfall):
+    with pytest.raises(ValueError):
+        waterfall.set_range(1.0, 1.0)
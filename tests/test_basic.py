@@ -28,6 +28,9 @@ def test_init(root):
     RotaryScale(root).grid()
     Gauge(root).grid()
     Graph(root, 0, 10, 0, 10, 0.1, 0.1).grid()
+    Waterfall(root, bins=64).grid()
+    BarChart(root, 4, 0, 10, 1).grid()
+    Histogram(root).grid()
     Led(root).grid()
     EntryGrid(root, 3).grid()
     LabelGrid(root, 3).grid()
@@ -1,6 +1,16 @@
 import importlib.metadata
 
-from tk_tools.canvas import Gauge, Graph, Led, RotaryScale
+from tk_tools.canvas import (
+    BarChart,
+    Gauge,
+    Graph,
+    Histogram,
+    Led,
+    MultiGraph,
+    RotaryScale,
+    SpectrumAnalyzer,
+    Waterfall,
+)
 
 from tk_tools.groups import (
     ButtonGrid,
@@ -29,6 +39,7 @@ __version__ = importlib.metadata.version("tk_tools")
 
 
 __all__ = [
+    "BarChart",
     "BinaryLabel",
     "ButtonGrid",
     "Calendar",
@@ -36,9 +47,11 @@ __all__ = [
     "EntryGrid",
     "Gauge",
     "Graph",
+    "Histogram",
     "KeyValueEntry",
     "LabelGrid",
     "Led",
+    "MultiGraph",
     "MultiSlotFrame",
     "RotaryScale",
     "ScrollableFrame",
@@ -48,6 +61,8 @@ __all__ = [
     "SmartSpinBox",
     "SevenSegment",
     "SevenSegmentDigits",
+    "SpectrumAnalyzer",
     "ToolTip",
+    "Waterfall",
     "__version__",
 ]
@@ -1,8 +1,20 @@
 import tkinter as tk
-import cmath
+import array
+import csv
 import sys
 import logging
-from decimal import Decimal
+import math
+import mmap
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby, islice
+from operator import itemgetter
 
 # these imports make autodoc easier to run
 try:
@@ -10,6 +22,12 @@ try:
 except ImportError:
     pass
 
+# numpy is optional; when present, array data is transformed in bulk
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 try:
     from tk_tools.images import (
         rotary_scale,
@@ -36,11 +54,226 @@ else:
 logger.info("frozen: {}".format(frozen))
 
 
+class _ImageCache:
+    """
+    Decoded images shared by all widgets of one Tk interpreter, keyed \
+    by the image data and subsample factor, so that each asset is \
+    decoded and scaled once however many widgets show it.  Beyond \
+    ``maxsize`` images the least recently used is evicted; widgets still \
+    showing an evicted image keep it alive.
+
+    :param master: the root window of the interpreter
+    """
+
+    maxsize = 64
+
+    def __init__(self, master):
+        self._master = master
+        self._images = OrderedDict()
+
+    @classmethod
+    def of(cls, widget):
+        """
+        Returns the cache of the interpreter to which a widget belongs
+
+        :param widget: any widget
+        :return: the :class:`_ImageCache`
+        """
+        root = widget._root()
+        cache = getattr(root, "_tk_tools_images", None)
+        if cache is None:
+            cache = root._tk_tools_images = cls(root)
+
+        return cache
+
+    def get(self, data: str, factor: int = 1):
+        """
+        Returns the image for the given data, decoding it if necessary
+
+        :param data: the image data as a base64 string
+        :param factor: the subsample factor
+        :return: the PhotoImage
+        """
+        key = data, factor
+        image = self._images.get(key)
+
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+
+        image = tk.PhotoImage(master=self._master, data=data)
+        if factor != 1:
+            image = image.subsample(factor, factor)
+
+        self._images[key] = image
+        if len(self._images) > self.maxsize:
+            self._images.popitem(last=False)
+
+        return image
+
+
+class _Animator:
+    """
+    The frame timer shared by all animated widgets of one Tk \
+    interpreter.  While any widget is moving, one ``after`` callback \
+    per frame steps every moving widget; the timer stops once all of \
+    them have arrived.
+
+    :param master: the root window of the interpreter
+    """
+
+    frame_ms = 16
+
+    def __init__(self, master):
+        self._master = master
+        self._widgets = {}
+        self._pending = None
+
+    @classmethod
+    def of(cls, widget):
+        """
+        Returns the animator of the interpreter to which a widget belongs
+
+        :param widget: any widget
+        :return: the :class:`_Animator`
+        """
+        root = widget._root()
+        animator = getattr(root, "_tk_tools_animator", None)
+        if animator is None:
+            animator = root._tk_tools_animator = cls(root)
+
+        return animator
+
+    def start(self, widget):
+        """
+        Steps the widget every frame until its ``_animate`` method \
+        returns False
+
+        :param widget: the widget to animate
+        :return: None
+        """
+        self._widgets[widget] = None
+        if self._pending is None:
+            self._pending = self._master.after(self.frame_ms, self._tick)
+
+    def _tick(self):
+        self._pending = None
+        now = time.monotonic()
+
+        for widget in list(self._widgets):
+            try:
+                moving = widget._animate(now)
+            except tk.TclError:
+                # the widget was destroyed
+                moving = False
+            if not moving:
+                del self._widgets[widget]
+
+        if self._widgets:
+            self._pending = self._master.after(self.frame_ms, self._tick)
+
+
+_easings = {
+    "linear": lambda t: t,
+    "ease_out": lambda t: 1.0 - (1.0 - t) ** 3,
+    "ease_in_out": lambda t: t * t * (3.0 - 2.0 * t),
+}
+
+
+class _NeedleAnimation:
+    """
+    Moves the needle of a dial-like widget smoothly from value to \
+    value.  With animation enabled, setting a value only records it as \
+    the target; the needle is drawn at most once per frame by the \
+    shared :class:`_Animator`, however often the value changes.  \
+    Widgets implement ``_draw_needle(value)``.
+    """
+
+    def _init_animation(self, animate: bool, duration: float, easing):
+        if not callable(easing) and easing not in _easings:
+            raise ValueError("easing must be one of {}".format(list(_easings)))
+
+        self.animate = animate
+        self.duration = duration
+        self._easing = easing if callable(easing) else _easings[easing]
+        self._shown = None
+        self._target = None
+
+    def _move_needle(self, value: float):
+        """
+        Moves the needle to a value, directly or by animation
+
+        :param value: the value
+        :return: None
+        """
+        if not self.animate or self._shown is None or self.duration <= 0:
+            self._shown = self._target = value
+            self._draw_needle(value)
+            return
+
+        # a new target restarts the movement from where the needle is
+        self._origin = self._shown
+        self._target = value
+        self._start = time.monotonic()
+        _Animator.of(self).start(self)
+
+    def _animate(self, now: float):
+        """
+        Draws one frame of the movement
+
+        :param now: the time of the frame
+        :return: True while the needle is still moving
+        """
+        t = min((now - self._start) / self.duration, 1.0)
+        if t < 1.0:
+            self._shown = self._origin + (self._target - self._origin) * self._easing(t)
+        else:
+            # the needle comes to rest exactly on the target
+            self._shown = self._target
+        self._draw_needle(self._shown)
+
+        return t < 1.0
+
+
+@lru_cache(maxsize=64)
+def _dial_table(center: float, radius: float, start: float, sweep: float):
+    """
+    Returns the points on a circle between two angles, one per pixel \
+    of arc so that neighbouring entries are the closest angles which \
+    can be told apart on screen.
+
+    :param center: the x and y coordinate of the center
+    :param radius: the radius in pixels
+    :param start: the angle of the first point in radians, clockwise \
+    from the positive x axis
+    :param sweep: the angle between the first and last points in radians
+    :return: a tuple of (x, y) canvas coordinates
+    """
+    steps = max(1, int(math.ceil(abs(radius * sweep))))
+
+    return tuple(
+        (
+            center + radius * math.cos(start + sweep * i / steps),
+            center + radius * math.sin(start + sweep * i / steps),
+        )
+        for i in range(steps + 1)
+    )
+
+
 class Dial(tk.Frame):
     """
-    Base class for all dials and dial-like widgets
+    Base class for all dials and dial-like widgets.  Positions on the \
+    dial are given as a fraction of the scale between ``start_angle`` \
+    and ``start_angle + sweep`` and looked up in tables of points \
+    computed once for each size, so that moving a needle costs no \
+    trigonometry.
     """
 
+    #: the angle of the start of the scale in radians, clockwise from 3 o'clock
+    start_angle = -math.pi / 2.0
+    #: the angle covered by the scale in radians
+    sweep = 2.0 * math.pi
+
     def __init__(self, parent, size: int = 100, **options):
         self._parent = parent
         super().__init__(self._parent, padx=3, pady=3, borderwidth=2, **options)
@@ -60,6 +293,39 @@ class Dial(tk.Frame):
         """
         return x + self.size / 2, y + self.size / 2
 
+    def point_at(self, fraction: float, radius: float):
+        """
+        Returns the canvas coordinates of a position on the scale
+
+        :param fraction: the position on the scale, from 0.0 at the \
+        start to 1.0 at the end; values beyond the scale are clamped
+        :param radius: the distance from the center in pixels
+        :return: an (x, y) tuple
+        """
+        table = _dial_table(self.size / 2, radius, self.start_angle, self.sweep)
+        fraction = 0.0 if fraction < 0.0 else 1.0 if fraction > 1.0 else fraction
+
+        return table[int(fraction * (len(table) - 1) + 0.5)]
+
+    def ticks(self, divisions: int, inner_radius: float, outer_radius: float):
+        """
+        Returns the tick marks which divide the scale into equal parts
+
+        :param divisions: the number of divisions
+        :param inner_radius: the distance from the center to the inner \
+        end of each tick
+        :param outer_radius: the distance from the center to the outer \
+        end of each tick
+        :return: a list of (x0, y0, x1, y1) tuples, one for each tick
+        """
+        return [
+            (
+                *self.point_at(tick / divisions, inner_radius),
+                *self.point_at(tick / divisions, outer_radius),
+            )
+            for tick in range(divisions)
+        ]
+
 
 class Compass(Dial):
     """
@@ -74,7 +340,7 @@ class Compass(Dial):
         # an arrow on top of the image
 
 
-class RotaryScale(Dial):
+class RotaryScale(_NeedleAnimation, Dial):
     """
     Shows a rotary scale, much like a speedometer.::
 
@@ -86,9 +352,17 @@ class RotaryScale(Dial):
     :param parent: tkinter parent frame
     :param max_value: the value corresponding to the maximum value on the scale
     :param size: the size in pixels
+    :param animate: True to move the needle smoothly to each new value \
+    rather than jump to it; the needle is drawn at most once per frame
+    :param duration: the time taken by each movement in seconds
+    :param easing: how the needle accelerates: 'linear', 'ease_out', \
+    'ease_in_out' or a function mapping 0.0-1.0 to 0.0-1.0
     :param options: the frame options
     """
 
+    start_angle = 2.0 * math.pi / 3.0
+    sweep = 5.0 * math.pi / 3.0
+
     def __init__(
         self,
         parent,
@@ -98,9 +372,13 @@ class RotaryScale(Dial):
         img_data: str = None,
         needle_color="blue",
         needle_thickness=0,
+        animate: bool = False,
+        duration: float = 0.25,
+        easing="ease_out",
         **options
     ):
         super().__init__(parent, size=size, **options)
+        self._init_animation(animate, duration, easing)
 
         self.max_value = float(max_value)
         self.size = size
@@ -113,12 +391,23 @@ class RotaryScale(Dial):
         self.readout = tk.Label(self, text="-{}".format(self.unit))
         self.readout.grid(row=1)
 
-        if img_data:
-            self.image = tk.PhotoImage(data=img_data)
+        self.image = _ImageCache.of(self).get(
+            img_data or rotary_scale, int(200 / self.size)
+        )
+
+        if self.needle_thickness == 0:
+            line_width = int(5 * self.size / 200)
+            line_width = 1 if line_width < 1 else line_width
         else:
-            self.image = tk.PhotoImage(data=rotary_scale)
+            line_width = self.needle_thickness
 
-        self.image = self.image.subsample(int(200 / self.size), int(200 / self.size))
+        # the image and needle are created once; set_value only moves
+        # the needle
+        self._image_item = self.canvas.create_image(0, 0, image=self.image, anchor="nw")
+        self._needle = self.canvas.create_line(
+            0, 0, 0, 0, width=line_width, fill=self.needle_color
+        )
+        self._readout_text = None
 
         initial_value = 0.0
         self.set_value(initial_value)
@@ -131,33 +420,26 @@ class RotaryScale(Dial):
         'max_range' or the scale will peg the limits
         :return: None
         """
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, image=self.image, anchor="nw")
-
         number = number if number <= self.max_value else self.max_value
         number = 0.0 if number < 0.0 else number
 
-        radius = 0.9 * self.size / 2.0
-        angle_in_radians = (2.0 * cmath.pi / 3.0) + number / self.max_value * (
-            5.0 * cmath.pi / 3.0
-        )
+        self._move_needle(number)
 
-        center = cmath.rect(0, 0)
-        outer = cmath.rect(radius, angle_in_radians)
-        if self.needle_thickness == 0:
-            line_width = int(5 * self.size / 200)
-            line_width = 1 if line_width < 1 else line_width
-        else:
-            line_width = self.needle_thickness
+        # reconfiguring the label costs a geometry pass, even for the
+        # same text
+        text = "{}{}".format(number, self.unit)
+        if text != self._readout_text:
+            self.readout["text"] = text
+            self._readout_text = text
 
-        self.canvas.create_line(
-            *self.to_absolute(center.real, center.imag),
-            *self.to_absolute(outer.real, outer.imag),
-            width=line_width,
-            fill=self.needle_color
-        )
+    def _draw_needle(self, number: float):
+        radius = 0.9 * self.size / 2.0
 
-        self.readout["text"] = "{}{}".format(number, self.unit)
+        self.canvas.coords(
+            self._needle,
+            *self.to_absolute(0, 0),
+            *self.point_at(number / self.max_value, radius),
+        )
 
     def _draw_background(self, divisions: int = 10):
         """
@@ -202,21 +484,11 @@ class RotaryScale(Dial):
         inner_tick_radius = int(self.size * 0.4)
         outer_tick_radius = int(self.size * 0.5)
 
-        for tick in range(divisions):
-            angle_in_radians = (2.0 * cmath.pi / 3.0) + tick / divisions * (
-                5.0 * cmath.pi / 3.0
-            )
-            inner_point = cmath.rect(inner_tick_radius, angle_in_radians)
-            outer_point = cmath.rect(outer_tick_radius, angle_in_radians)
-
-            self.canvas.create_line(
-                *self.to_absolute(inner_point.real, inner_point.imag),
-                *self.to_absolute(outer_point.real, outer_point.imag),
-                width=1
-            )
+        for tick in self.ticks(divisions, inner_tick_radius, outer_tick_radius):
+            self.canvas.create_line(*tick, width=1)
 
 
-class Gauge(tk.Frame):
+class Gauge(_NeedleAnimation, tk.Frame):
     """
     Shows a gauge, much like the RotaryGauge.::
 
@@ -238,6 +510,11 @@ class Gauge(tk.Frame):
     :param yellow_low: in percent warning for low values
     :param red_low: in percent if very low values are a danger
     :param bg: background
+    :param animate: True to sweep the needle smoothly to each new value \
+    rather than jump to it; the gauge is drawn at most once per frame
+    :param duration: the time taken by each movement in seconds
+    :param easing: how the needle accelerates: 'linear', 'ease_out', \
+    'ease_in_out' or a function mapping 0.0-1.0 to 0.0-1.0
     """
 
     def __init__(
@@ -255,6 +532,9 @@ class Gauge(tk.Frame):
         yellow_low=0,
         red_low=0,
         bg="lightgrey",
+        animate: bool = False,
+        duration: float = 0.25,
+        easing="ease_out",
     ):
         self._parent = parent
         self._width = width
@@ -277,16 +557,21 @@ class Gauge(tk.Frame):
         self._min_value = EngNumber(min_value)
         self._max_value = EngNumber(max_value)
         self._value = self._min_value
+        self._needle_value = float(self._min_value)
+        self._init_animation(animate, duration, easing)
         self._redraw()
+        self._shown = self._needle_value
 
     def _redraw(self):
+        """
+        Draws the whole gauge.  Only the value arc and the readout \
+        change afterwards, so this is needed again only when the \
+        size or the scale changes.
+
+        :return: None
+        """
         self._canvas.delete("all")
         max_angle = 120.0
-        value_as_percent = (self._value - self._min_value) / (
-            self._max_value - self._min_value
-        )
-        value = float(max_angle * value_as_percent)
-        # no int() => accuracy
         # create the tick marks and colors across the top
         for i in range(self._divisions):
             extent = max_angle / self._divisions
@@ -329,7 +614,7 @@ class Gauge(tk.Frame):
             style="pie",
         )
         # readout & title
-        self.readout(self._value, "black")  # BG black if OK
+        self._draw_readout()
 
         # display lowest value
         value_text = "{}".format(self._min_value)
@@ -356,13 +641,13 @@ class Gauge(tk.Frame):
             text=value_text,
         )
         # create first half (red needle)
-        self._canvas.create_arc(
+        self._value_arc = self._canvas.create_arc(
             0,
             int(self._height * 0.15),
             self._width,
             int(self._height * 1.8),
             start=150,
-            extent=-value,
+            extent=-self._extent(self._needle_value),
             width=3,
             outline=red,
         )
@@ -393,17 +678,26 @@ class Gauge(tk.Frame):
             outline="#343434",
         )
 
-    def readout(self, value, bg):  # value, BG color
+    def _extent(self, value: float):
+        max_angle = 120.0
+        value_as_percent = (value - float(self._min_value)) / float(
+            self._max_value - self._min_value
+        )
+        # no int() => accuracy
+        return float(max_angle * value_as_percent)
+
+    def _draw_readout(self):
         # draw the black behind the readout
         r_width = 95
         r_height = 20
         r_offset = 8
-        self._canvas.create_rectangle(
+        self._readout_bg = "black"  # BG black if OK
+        self._readout_box = self._canvas.create_rectangle(
             self._width / 2.0 - r_width / 2.0,
             self._height / 2.0 - r_height / 2.0 + r_offset,
             self._width / 2.0 + r_width / 2.0,
             self._height / 2.0 + r_height / 2.0 + r_offset,
-            fill=bg,
+            fill=self._readout_bg,
             outline="grey",
         )
         # the digital readout
@@ -414,204 +708,3865 @@ class Gauge(tk.Frame):
             text=self._label,
         )
 
-        value_text = "{}{}".format(self._value, self._unit)
-        self._canvas.create_text(
+        self._readout_text = "{}{}".format(self._value, self._unit)
+        self._readout_item = self._canvas.create_text(
             self._width * 0.5,
             self._height * 0.5 + r_offset,
             font=("Courier New", 10),
-            text=value_text,
+            text=self._readout_text,
             fill="white",
         )
 
+    def readout(self, value, bg):  # value, BG color
+        """
+        Updates the digital readout, touching only what changed
+
+        :param value: the value to show
+        :param bg: the background color of the readout
+        :return: None
+        """
+        if bg != self._readout_bg:
+            self._canvas.itemconfigure(self._readout_box, fill=bg)
+            self._readout_bg = bg
+
+        value_text = "{}{}".format(value, self._unit)
+        if value_text != self._readout_text:
+            self._canvas.itemconfigure(self._readout_item, text=value_text)
+            self._readout_text = value_text
+
     def set_value(self, value):
         self._value = EngNumber(value)
         if self._min_value * 1.02 < value < self._max_value * 0.98:
-            self._redraw()  # refresh all
+            self.readout(self._value, "black")  # BG black if OK
+            self._move_needle(float(value))
         else:  # OFF limits refresh only readout
             self.readout(self._value, "red")  # on RED BackGround
 
+    def _draw_needle(self, value: float):
+        self._needle_value = value
+        self._canvas.itemconfigure(self._value_arc, extent=-self._extent(value))
 
-class Graph(tk.Frame):
+
+def _decimate_minmax(points, x_min: float, x_max: float, columns: int):
     """
-    Tkinter native graph (pretty basic, but doesn't require heavy install).::
+    Reduces a series sorted by x to the minimum and maximum point \
+    within each pixel column between x_min and x_max.  Points \
+    outside of the range are collapsed into one column on either \
+    side so that lines leaving the plot area are preserved.
 
-        graph = tk_tools.Graph(
-            parent=root,
-            x_min=-1.0,
-            x_max=1.0,
-            y_min=0.0,
-            y_max=2.0,
-            x_tick=0.2,
-            y_tick=0.2,
-            width=500,
-            height=400
-        )
+    :param points: a sequence of (x, y) tuples sorted by x
+    :param x_min: the x value at the left edge of the plot area
+    :param x_max: the x value at the right edge of the plot area
+    :param columns: the number of pixel columns in the plot area
+    :return: a list of (x, y) tuples in their original order
+    """
+    if len(points) <= 2 * columns or x_max <= x_min:
+        return list(points)
 
-        graph.grid(row=0, column=0)
+    scale = columns / (x_max - x_min)
+    decimated = []
 
-        # create an initial line
-        line_0 = [(x/10, x/10) for x in range(10)]
-        graph.plot_line(line_0)
+    current = None
+    lo = hi = None
+    for i, (x, y) in enumerate(points):
+        offset = (x - x_min) * scale
+        if offset < 0:
+            column = -1
+        elif offset >= columns:
+            column = columns
+        else:
+            column = int(offset)
 
-    :param parent: the parent frame
-    :param x_min: the x minimum
-    :param x_max: the x maximum
-    :param y_min: the y minimum
-    :param y_max: the y maximum
-    :param x_tick: the 'tick' on the x-axis
-    :param y_tick: the 'tick' on the y-axis
-    :param options: additional valid tkinter.canvas options
+        if column != current:
+            if current is not None:
+                decimated.extend(_ordered_extrema(lo, hi))
+            current = column
+            lo = hi = (i, x, y)
+        elif y < lo[2]:
+            lo = (i, x, y)
+        elif y > hi[2]:
+            hi = (i, x, y)
+
+    if current is not None:
+        decimated.extend(_ordered_extrema(lo, hi))
+
+    return decimated
+
+
+def _ordered_extrema(lo, hi):
     """
+    Returns the (x, y) points of the indexed extrema lo and hi in \
+    their original order, without duplicates
+    """
+    if lo[0] == hi[0]:
+        return [lo[1:]]
+    elif lo[0] < hi[0]:
+        return [lo[1:], hi[1:]]
+    return [hi[1:], lo[1:]]
 
-    def __init__(
-        self,
-        parent,
-        x_min: float,
-        x_max: float,
-        y_min: float,
-        y_max: float,
-        x_tick: float,
-        y_tick: float,
-        **options
-    ):
-        self._parent = parent
-        super().__init__(self._parent, **options)
 
-        self.canvas = tk.Canvas(self)
-        self.canvas.grid(row=0, column=0)
+def _decimate_lttb(points, threshold: int):
+    """
+    Reduces a series to ``threshold`` points using the \
+    Largest-Triangle-Three-Buckets algorithm, which keeps the points \
+    that contribute most to the visual shape of the line.
 
-        self.w = float(self.canvas.config("width")[4])
-        self.h = float(self.canvas.config("height")[4])
-        self.x_min = x_min
-        self.x_max = x_max
-        self.x_tick = x_tick
-        self.y_min = y_min
-        self.y_max = y_max
-        self.y_tick = y_tick
-        self.px_x = (self.w - 100) / ((x_max - x_min) / x_tick)
-        self.px_y = (self.h - 100) / ((y_max - y_min) / y_tick)
+    :param points: a sequence of (x, y) tuples sorted by x
+    :param threshold: the number of points to keep
+    :return: a list of (x, y) tuples
+    """
+    length = len(points)
+    if threshold >= length or threshold < 3:
+        return list(points)
 
-        self.draw_axes()
+    points = points if isinstance(points, list) else list(points)
 
-    def draw_axes(self):
-        """
-        Removes all existing series and re-draws the axes.
+    sampled = [points[0]]
+    bucket_size = (length - 2) / (threshold - 2)
 
-        :return: None
-        """
-        self.canvas.delete("all")
-        rect = 50, 50, self.w - 50, self.h - 50
+    a = 0
+    for i in range(threshold - 2):
+        # the average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(p[0] for p in points[next_start:next_end]) / next_count
+        avg_y = sum(p[1] for p in points[next_start:next_end]) / next_count
 
-        self.canvas.create_rectangle(rect, outline="black")
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
 
-        for x in self.frange(0, self.x_max - self.x_min + 1, self.x_tick):
-            value = Decimal(self.x_min + x)
-            if self.x_min <= value <= self.x_max:
-                x_step = (self.px_x * x) / self.x_tick
-                coord = 50 + x_step, self.h - 50, 50 + x_step, self.h - 45
-                self.canvas.create_line(coord, fill="black")
-                coord = 50 + x_step, self.h - 40
+        ax, ay = points[a]
+        max_area = -1.0
+        for j in range(start, end):
+            bx, by = points[j]
+            area = abs((ax - avg_x) * (by - ay) - (ax - bx) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                a_next = j
 
-                label = round(Decimal(self.x_min + x), 1)
-                self.canvas.create_text(coord, fill="black", text=label)
+        sampled.append(points[a_next])
+        a = a_next
 
-        for y in self.frange(0, self.y_max - self.y_min + 1, self.y_tick):
-            value = Decimal(self.y_max - y)
+    sampled.append(points[-1])
 
-            if self.y_min <= value <= self.y_max:
-                y_step = (self.px_y * y) / self.y_tick
-                coord = 45, 50 + y_step, 50, 50 + y_step
-                self.canvas.create_line(coord, fill="black")
-                coord = 35, 50 + y_step
+    return sampled
 
-                label = round(value, 1)
-                self.canvas.create_text(coord, fill="black", text=label)
 
-    def plot_point(self, x, y, visible=True, color="black", size=5):
-        """
-        Places a single point on the grid
+@lru_cache(maxsize=256)
+def _tick_layout(v_min: float, v_max: float, tick: float, length: float):
+    """
+    Calculates the position and label of each tick along an axis.  \
+    Ticks are placed on the multiples of ``tick`` that lie within the \
+    range and are labelled with as many decimal places as ``tick`` \
+    requires (at least one).  Results are cached, so repeated redraws \
+    of the same axis are free.
 
-        :param x: the x coordinate
-        :param y: the y coordinate
-        :param visible: True if the individual point should be visible
-        :param color: the color of the point
-        :param size: the point size in pixels
-        :return: The absolute coordinates as a tuple
-        """
-        xp = (self.px_x * (x - self.x_min)) / self.x_tick
-        yp = (self.px_y * (self.y_max - y)) / self.y_tick
-        coord = 50 + xp, 50 + yp
+    :param v_min: the value at the start of the axis
+    :param v_max: the value at the end of the axis
+    :param tick: the interval between ticks
+    :param length: the length of the axis in pixels
+    :return: a tuple of (offset, label) pairs, in which offset is the \
+    distance in pixels from the start of the axis
+    """
+    span = v_max - v_min
+    if span <= 0 or tick <= 0:
+        return ()
 
-        if visible:
-            # divide down to an appropriate size
-            size = int(size / 2) if int(size / 2) > 1 else 1
-            x, y = coord
+    # tolerate floating-point error of a tiny fraction of a tick
+    epsilon = 1e-9
+    first = math.ceil(v_min / tick - epsilon)
+    last = math.floor(v_max / tick + epsilon)
 
-            self.canvas.create_oval(x - size, y - size, x + size, y + size, fill=color)
+    decimals = 1
+    while decimals < 12 and abs(round(tick, decimals) - tick) > epsilon * tick:
+        decimals += 1
 
-        return coord
+    layout = []
+    for i in range(first, last + 1):
+        value = i * tick
+        label = "{:.{}f}".format(value, decimals)
+        if float(label) == 0.0:
+            label = "{:.{}f}".format(0.0, decimals)
+
+        layout.append(((value - v_min) * length / span, label))
+
+    return tuple(layout)
 
-    def plot_line(self, points: list, color="black", point_visibility=False):
+
+class _MinMaxPyramid:
+    """
+    A level-of-detail index over a list of (x, y) points sorted by x.  \
+    Level ``k`` holds the lowest and highest point of every bucket of \
+    ``2 ** k`` consecutive points, so any window of the data can be \
+    reduced to a fixed number of points without visiting every point \
+    within the window.
+
+    The index refers to the list it was created with and must be told \
+    about points appended to that list using :meth:`add`.
+
+    :param points: the list of (x, y) points to index
+    """
+
+    def __init__(self, points: list):
+        self._points = points
+        self._levels = []
+        self.rebuild()
+
+    def rebuild(self):
         """
-        Plot a line of points
+        Builds all levels from scratch
 
-        :param points: a list of tuples, each tuple containing an (x, y) point
-        :param color: the color of the line
-        :param point_visibility: True if the points \
-        should be individually visible
         :return: None
         """
-        last_point = ()
-        for point in points:
-            this_point = self.plot_point(
-                point[0], point[1], color=color, visible=point_visibility
-            )
+        self._levels = []
+        while self._top_length() > 1:
+            self._add_level()
 
-            if last_point:
-                self.canvas.create_line(last_point + this_point, fill=color)
-            last_point = this_point
-            # print last_point
+    def add(self, i: int):
+        """
+        Updates the index for the point at position ``i`` of the list.  \
+        Points must be added in order.
 
-    @staticmethod
-    def frange(start, stop, step, digits_to_round=3):
+        :param i: the position of the new point
+        :return: None
         """
-        Works like range for doubles
+        point = self._points[i]
 
-        :param start: starting value
-        :param stop: ending value
-        :param step: the increment_value
-        :param digits_to_round: the digits to which to round \
-        (makes floating-point numbers much easier to work with)
-        :return: generator
+        for k, level in enumerate(self._levels, start=1):
+            j = i >> k
+            if j < len(level):
+                lo, hi = level[j]
+                if point[1] < lo[1]:
+                    level[j] = (point, hi)
+                elif point[1] > hi[1]:
+                    level[j] = (lo, point)
+            else:
+                level.append((point, point))
+
+        while self._top_length() > 1:
+            self._add_level()
+
+    def window(self, x_min: float, x_max: float, columns: int):
         """
-        while start < stop:
-            yield round(start, digits_to_round)
-            start += step
+        Returns the points between x_min and x_max, reduced to roughly \
+        two points per column using the coarsest level that still \
+        provides at least one bucket per column.  The points on either \
+        side of the window are included so that lines leaving the window \
+        are preserved.
 
+        :param x_min: the lowest x value of the window
+        :param x_max: the highest x value of the window
+        :param columns: the number of pixel columns of the window
+        :return: a list of (x, y) tuples sorted by x
+        """
+        points = self._points
+        start = max(bisect_left(points, x_min, key=_x_of) - 1, 0)
+        end = min(bisect_right(points, x_max, key=_x_of) + 1, len(points))
+        count = end - start
 
-class Led(tk.Frame):
-    """
-    Create an LED-like interface for the user.::
+        if count <= 2 * columns or not self._levels:
+            return points[start:end]
 
-        led = tk_tools.Led(root, size=50)
-        led.pack()
+        level = 1
+        while (count >> level) > columns and level < len(self._levels):
+            level += 1
 
-        led.to_red()
-        led.to_green(on=True)
+        # the buckets of the level are aligned to multiples of their
+        # size, so the ends of the window which only partly fill a
+        # bucket are covered by the smaller buckets of lower levels
+        # instead; no bucket reaches outside of the window
+        size = 1 << level
+        buckets = []
+        i = start
+        while i < end and i & (size - 1):
+            k = (i & -i).bit_length() - 1
+            while i + (1 << k) > end:
+                k -= 1
+            buckets.append(self._bucket(i, k))
+            i += 1 << k
 
-    The user also has the option of adding an `on_click_callback`
-    function.  When the button is clicked, the button will change
-    state and the on-click callback will be executed.  The
-    callback must accept a single boolean parameter, `on`, which
-    indicates if the LED was just turned on or off.
+        whole = (end - i) >> level
+        buckets.extend(self._levels[level - 1][i >> level : (i >> level) + whole])
+        i += whole << level
 
-    :param parent: the parent frame
-    :param size: the size in pixels
-    :param on_click_callback: a callback which accepts a boolean parameter 'on'
-    :param options: the frame options
-    """
+        k = level
+        while i < end:
+            while i + (1 << k) > end:
+                k -= 1
+            buckets.append(self._bucket(i, k))
+            i += 1 << k
 
-    def __init__(
+        # the exact first and last points keep the line continuous
+        # across the edges of the window
+        reduced = [points[start]]
+        for lo, hi in buckets:
+            if lo is hi:
+                reduced.append(lo)
+            elif lo[0] <= hi[0]:
+                reduced.extend((lo, hi))
+            else:
+                reduced.extend((hi, lo))
+        reduced.append(points[end - 1])
+
+        return reduced
+
+    def _bucket(self, i: int, k: int):
+        """
+        Returns the lowest and highest of the ``2 ** k`` points starting \
+        at position ``i``, which must be a multiple of ``2 ** k``
+        """
+        if k == 0:
+            return self._points[i], self._points[i]
+        return self._levels[k - 1][i >> k]
+
+    def _top_length(self):
+        return len(self._levels[-1]) if self._levels else len(self._points)
+
+    def _add_level(self):
+        """
+        Creates a new level by merging pairs of buckets of the level below
+        """
+        if not self._levels:
+            points = self._points
+            level = [
+                (a, b) if a[1] <= b[1] else (b, a)
+                for a, b in zip(points[0::2], points[1::2])
+            ]
+            if len(points) % 2:
+                level.append((points[-1], points[-1]))
+
+            self._levels.append(level)
+            return
+
+        below = self._levels[-1]
+        level = []
+        for i in range(0, len(below) - 1, 2):
+            (lo_a, hi_a), (lo_b, hi_b) = below[i], below[i + 1]
+            level.append(
+                (
+                    lo_b if lo_b[1] < lo_a[1] else lo_a,
+                    hi_b if hi_b[1] > hi_a[1] else hi_a,
+                )
+            )
+        if len(below) % 2:
+            level.append(below[-1])
+
+        self._levels.append(level)
+
+
+_x_of = itemgetter(0)
+
+
+def _decimate_minmax_arrays(x, y, x_min: float, x_max: float, columns: int):
+    """
+    The NumPy equivalent of :func:`_decimate_minmax`, operating on \
+    separate x and y arrays sorted by x.
+
+    :param x: a NumPy array of x values sorted in ascending order
+    :param y: a NumPy array of y values
+    :param x_min: the x value at the left edge of the plot area
+    :param x_max: the x value at the right edge of the plot area
+    :param columns: the number of pixel columns in the plot area
+    :return: a tuple of the decimated (x, y) arrays
+    """
+    if len(x) <= 2 * columns or x_max <= x_min:
+        return x, y
+
+    # since x is sorted, each column is a contiguous run of the arrays
+    # the search values match the type of x, since searching with
+    # another type would convert a copy of the whole array
+    edges = np.searchsorted(
+        x,
+        (x_min + np.arange(columns + 1) * ((x_max - x_min) / columns)).astype(x.dtype),
+    )
+    bounds = [0] + edges.tolist() + [len(x)]
+
+    keep = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if start == end:
+            continue
+
+        segment = y[start:end]
+        lo = start + int(segment.argmin())
+        hi = start + int(segment.argmax())
+
+        if lo == hi:
+            keep.append(lo)
+        else:
+            keep.extend((lo, hi) if lo < hi else (hi, lo))
+
+    return x[keep], y[keep]
+
+
+def _nice_tick(span: float, count: int):
+    """
+    Chooses a tick of 1, 2 or 5 times a power of ten which divides \
+    ``span`` into about ``count`` intervals
+
+    :param span: the range of the axis
+    :param count: the desired number of intervals
+    :return: the tick
+    """
+    raw = span / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5):
+        if multiple * magnitude >= raw:
+            return multiple * magnitude
+
+    return 10 * magnitude
+
+
+class _RunningExtrema:
+    """
+    The minimum and maximum of a sequence of values which grows at the \
+    end and, for sliding windows, shrinks at the front.  For sliding \
+    windows each value is held in a monotonic deque only for as long \
+    as it could still become the minimum or maximum, so that each value \
+    is pushed and popped at most once: amortized O(1) per value.
+
+    :param sliding: True if values are dropped from the front
+    """
+
+    def __init__(self, sliding: bool):
+        self.sliding = sliding
+        self.clear()
+
+    @property
+    def count(self):
+        return self._pushed - self._dropped
+
+    def clear(self):
+        self.min = self.max = None
+        self._pushed = 0
+        self._dropped = 0
+        self._lows = deque()
+        self._highs = deque()
+
+    def push(self, values):
+        """
+        Adds values to the end of the sequence
+
+        :param values: an iterable of numbers
+        :return: None
+        """
+        values = list(values)
+        if not values:
+            return
+
+        if not self.sliding:
+            self._pushed += len(values)
+            self.min = min(values) if self.min is None else min(self.min, min(values))
+            self.max = max(values) if self.max is None else max(self.max, max(values))
+            return
+
+        # (index, value) pairs, ascending in lows and descending in
+        # highs, so that the extremes are always at the front
+        lows, highs = self._lows, self._highs
+        for value in values:
+            while lows and lows[-1][1] >= value:
+                lows.pop()
+            lows.append((self._pushed, value))
+            while highs and highs[-1][1] <= value:
+                highs.pop()
+            highs.append((self._pushed, value))
+            self._pushed += 1
+
+        self._update()
+
+    def drop(self, count: int):
+        """
+        Removes values from the front of a sliding sequence
+
+        :param count: the number of values to remove
+        :return: None
+        """
+        if not count:
+            return
+
+        self._dropped += count
+
+        while self._lows and self._lows[0][0] < self._dropped:
+            self._lows.popleft()
+        while self._highs and self._highs[0][0] < self._dropped:
+            self._highs.popleft()
+
+        self._update()
+
+    def _update(self):
+        self.min = self._lows[0][1] if self._lows else None
+        self.max = self._highs[0][1] if self._highs else None
+
+
+class _StreamStats:
+    """
+    Running statistics of the y values of a series, updated point by \
+    point as points arrive: the mean and standard deviation, either \
+    over all points (Welford's algorithm) or exponentially weighted, \
+    and the minimum and maximum of the last ``envelope`` points.  The \
+    statistics after each point are kept as a tuple of (x, mean, \
+    deviation, low, high).
+
+    :param alpha: the weight of each new point for exponentially \
+    weighted statistics, or None for statistics over all points
+    :param envelope: the number of points over which the minimum and \
+    maximum are taken, or None
+    :param bounded: True to keep the statistics in a ring buffer, like \
+    the points of a series with a ``maxlen``
+    :param maxlen: the size of the ring buffer
+    """
+
+    def __init__(
+        self,
+        alpha: float = None,
+        envelope: int = None,
+        bounded: bool = False,
+        maxlen: int = None,
+    ):
+        self.alpha = alpha
+        self.envelope = envelope
+        self.points = deque(maxlen=maxlen) if bounded else []
+        self.clear()
+
+    def clear(self):
+        self.points.clear()
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self._m2 = 0.0
+        self._extrema = _RunningExtrema(sliding=True)
+
+    def push(self, points):
+        """
+        Updates the statistics with new points
+
+        :param points: an iterable of (x, y) tuples
+        :return: None
+        """
+        alpha, envelope, extrema = self.alpha, self.envelope, self._extrema
+        append = self.points.append
+        low = high = None
+
+        for x, y in points:
+            self.count += 1
+            delta = y - self.mean
+
+            if alpha is None:
+                self.mean += delta / self.count
+                self._m2 += delta * (y - self.mean)
+                self.variance = self._m2 / self.count
+            elif self.count == 1:
+                self.mean = y
+            else:
+                self.mean += alpha * delta
+                self.variance = (1.0 - alpha) * (self.variance + alpha * delta * delta)
+
+            if envelope is not None:
+                extrema.push((y,))
+                extrema.drop(
+                    extrema.count - envelope if extrema.count > envelope else 0
+                )
+                low, high = extrema.min, extrema.max
+
+            append((x, self.mean, math.sqrt(self.variance), low, high))
+
+    def trim(self, x_min: float):
+        """
+        Discards the statistics of points which have scrolled off the \
+        left of a strip chart, keeping the last of them
+
+        :param x_min: the x minimum of the graph
+        :return: None
+        """
+        points = self.points
+        while len(points) > 1 and points[1][0] <= x_min:
+            points.popleft()
+
+
+def _interleave(xs: list, ys: list):
+    """
+    Combines lists of x and y pixel values into a flat coordinate list
+
+    :return: a list [x0, y0, x1, y1, ...]
+    """
+    coords = [0.0] * (2 * len(xs))
+    coords[0::2] = xs
+    coords[1::2] = ys
+
+    return coords
+
+
+def _tail(points, count: int):
+    """
+    Returns the last points of a list or deque, oldest first.  Unlike \
+    ``islice``, this does not walk the points before them, so it takes \
+    time proportional to ``count`` alone.
+
+    :param points: a list or deque
+    :param count: the number of points
+    :return: a sequence or iterator of the points
+    """
+    if isinstance(points, deque):
+        return reversed(list(islice(reversed(points), count)))
+    if isinstance(points, list):
+        return points[len(points) - count :]
+    return islice(points, len(points) - count, None)
+
+
+def _to_coords(points, view):
+    """
+    Transforms a sequence of (x, y) points into the flat list of canvas \
+    coordinates expected by ``canvas.create_line`` and ``canvas.coords``
+
+    :param points: an iterable of (x, y) tuples
+    :param view: the transform of a graph, see :meth:`Graph._view`
+    :return: a flat list [x0, y0, x1, y1, ...] in pixels
+    """
+    x_scale, x_offset, y_scale, y_offset = view
+
+    coords = []
+    append = coords.append
+    for x, y in points:
+        append(x_offset + x * x_scale)
+        append(y_offset - y * y_scale)
+
+    return coords
+
+
+def _to_coords_arrays(x, y, view):
+    """
+    The vectorized equivalent of :func:`_to_coords` for NumPy arrays of \
+    x and y values
+    """
+    x_scale, x_offset, y_scale, y_offset = view
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+
+    coords = np.empty(2 * len(x))
+    coords[0::2] = x * x_scale + x_offset
+    coords[1::2] = y_offset - y * y_scale
+
+    return coords.tolist()
+
+
+class _ArrayPoints:
+    """
+    A read-only sequence of (x, y) tuples backed by separate x and y \
+    arrays, so that array data may be used wherever a list of points \
+    is expected without first being converted.
+
+    :param x: the x values
+    :param y: the y values
+    """
+
+    def __init__(self, x, y):
+        if len(x) != len(y):
+            raise ValueError("x and y must be the same length")
+
+        self.x = x
+        self.y = y
+
+    def __len__(self):
+        return len(self.x)
+
+    def __iter__(self):
+        return zip(self.x, self.y)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(zip(self.x[index], self.y[index]))
+        return self.x[index], self.y[index]
+
+
+class _MappedPoints(_ArrayPoints):
+    """
+    Points whose x and y values are mapped from binary files rather \
+    than held in memory; see :meth:`Series.map_file`.
+    """
+
+
+def _map_file(path: str, dtype: str, offset: int = 0):
+    """
+    Maps a binary file of numbers into memory without reading it.  \
+    Pages of the file are only read from disk as the values within \
+    them are accessed.
+
+    :param path: the path of the file
+    :param dtype: the type of the values, such as 'float32'; without \
+    NumPy only 'float32' and 'float64' in native byte order are supported
+    :param offset: the number of bytes before the first value, such \
+    as the size of a file header
+    :return: a NumPy memmap, or a memoryview if NumPy is not installed
+    """
+    if np is not None:
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset)
+
+    typecode = _typecode(dtype)
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)[offset:]
+    if len(view) % array.array(typecode).itemsize:
+        raise ValueError("the size of the file is not a multiple of the dtype size")
+
+    return view.cast(typecode)
+
+
+def _typecode(dtype: str):
+    """
+    Returns the ``array`` type code used in place of a NumPy dtype when \
+    NumPy is not installed
+
+    :param dtype: 'float32' or 'float64'
+    :return: the type code
+    """
+    typecodes = {"float32": "f", "float64": "d"}
+    if dtype not in typecodes:
+        raise ValueError(
+            "dtype must be one of {} without numpy".format(list(typecodes))
+        )
+
+    return typecodes[dtype]
+
+
+def _read_csv(
+    f, x_column: int, y_column: int, delimiter: str, skip_rows: int, chunk_size: int
+):
+    """
+    Parses (x, y) points from a CSV file in chunks
+
+    :param f: the file, opened in binary mode
+    :param x_column: the index of the column holding x values
+    :param y_column: the index of the column holding y values
+    :param delimiter: the character separating the columns
+    :param skip_rows: the number of header rows to skip
+    :param chunk_size: the number of points in each chunk
+    :return: a generator of lists of (x, y) tuples
+    """
+    lines = (line.decode("utf-8") for line in islice(f, skip_rows, None))
+
+    chunk = []
+    for row in csv.reader(lines, delimiter=delimiter):
+        if not row:
+            continue
+
+        chunk.append((float(row[x_column]), float(row[y_column])))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _read_binary(f, dtype: str, chunk_size: int):
+    """
+    Reads (x, y) points from a binary file of interleaved x and y \
+    values in chunks
+
+    :param f: the file, opened in binary mode
+    :param dtype: the type of the values, see :func:`_map_file`
+    :param chunk_size: the number of points in each chunk
+    :return: a generator of lists of (x, y) tuples
+    """
+    if np is not None:
+        item_size = np.dtype(dtype).itemsize
+    else:
+        typecode = _typecode(dtype)
+        item_size = array.array(typecode).itemsize
+
+    while True:
+        data = f.read(2 * item_size * chunk_size)
+        if not data:
+            return
+        if len(data) % (2 * item_size):
+            raise ValueError("the file ends with an incomplete x and y pair")
+
+        if np is not None:
+            values = np.frombuffer(data, dtype=dtype).tolist()
+        else:
+            values = array.array(typecode, data).tolist()
+
+        yield list(zip(values[0::2], values[1::2]))
+
+
+class _GridIndex:
+    """
+    A uniform grid over a sequence of (x, y) points in which each cell \
+    lists the points that fall within it, used to find the nearest \
+    point to a position without visiting every point.  Cells are square \
+    on screen and sized to hold a few points each on average.
+
+    :param points: the sequence of (x, y) points to index
+    :param x_scale: pixels per x unit
+    :param y_scale: pixels per y unit
+    """
+
+    points_per_cell = 4
+
+    def __init__(self, points, x_scale: float, y_scale: float):
+        self._points = points
+
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        width = (max(xs) - min(xs)) * x_scale
+        height = (max(ys) - min(ys)) * y_scale
+        cells = max(len(points) / self.points_per_cell, 1)
+        side = math.sqrt(width * height / cells) or max(width, height) / cells or 1.0
+
+        self._cell_x = side / x_scale
+        self._cell_y = side / y_scale
+
+        self._cells = {}
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            key = (math.floor(x / self._cell_x), math.floor(y / self._cell_y))
+            self._cells.setdefault(key, []).append(i)
+
+        columns = [key[0] for key in self._cells]
+        rows = [key[1] for key in self._cells]
+        self._bounds = min(columns), max(columns), min(rows), max(rows)
+
+    def nearest(self, x: float, y: float, x_scale: float, y_scale: float):
+        """
+        Finds the point nearest to (x, y), measuring distance in pixels
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :param x_scale: pixels per x unit
+        :param y_scale: pixels per y unit
+        :return: the nearest (x, y) point
+        """
+        column = math.floor(x / self._cell_x)
+        row = math.floor(y / self._cell_y)
+        col_min, col_max, row_min, row_max = self._bounds
+        last_ring = max(
+            abs(column - col_min),
+            abs(column - col_max),
+            abs(row - row_min),
+            abs(row - row_max),
+        )
+
+        # every point beyond ring r is at least r cells away
+        cell_size = min(self._cell_x * x_scale, self._cell_y * y_scale)
+
+        best, best_distance = None, math.inf
+        for ring in range(last_ring + 1):
+            for key in self._ring(column, row, ring):
+                for i in self._cells.get(key, ()):
+                    px, py = self._points[i]
+                    distance = math.hypot((px - x) * x_scale, (py - y) * y_scale)
+                    if distance < best_distance:
+                        best, best_distance = self._points[i], distance
+
+            if best is not None and best_distance <= ring * cell_size:
+                break
+
+        return best
+
+    @staticmethod
+    def _ring(column: int, row: int, ring: int):
+        """
+        Yields the keys of the cells at a Chebyshev distance of ``ring`` \
+        from the given cell
+        """
+        if ring == 0:
+            yield column, row
+            return
+
+        for i in range(column - ring, column + ring + 1):
+            yield i, row - ring
+            yield i, row + ring
+        for j in range(row - ring + 1, row + ring):
+            yield column - ring, j
+            yield column + ring, j
+
+
+class Series:
+    """
+    A handle to a single series of points on a :class:`Graph`.  Series \
+    are normally created by :meth:`Graph.plot_line` or \
+    :meth:`Graph.add_series` rather than instantiated directly.::
+
+        series = graph.add_series("sensor", color="blue", maxlen=1000)
+        series.append(0.0, 1.2)
+        series.extend([(0.1, 1.3), (0.2, 1.1)])
+        series.delete()
+
+    The series is drawn using one ``create_line`` item per \
+    ``chunk_size`` points, so the number of canvas items stays small \
+    no matter how many points are plotted.  New points update the \
+    existing items in place using ``canvas.coords``.
+
+    Series without a ``maxlen`` whose x values are in ascending order \
+    maintain a min/max level-of-detail index as points are added, so \
+    that any window of a very large series can be drawn at a cost \
+    proportional to the width of the plot rather than the number of \
+    points.
+
+    Data already held in NumPy arrays or ``array.array`` buffers may \
+    be given to :meth:`set_data`, which keeps the arrays as they are \
+    and, when NumPy is installed, crops, decimates and transforms \
+    them without creating a tuple per point.
+
+    When ``maxlen`` is given, the points are kept in a ring buffer of \
+    that size and the oldest points are discarded as new ones arrive, \
+    so memory and item count remain bounded for streaming data.
+
+    :param graph: the :class:`Graph` on which the series is drawn
+    :param name: the name of the series
+    :param color: the color of the line
+    :param width: the width of the line in pixels
+    :param maxlen: the maximum number of points retained, or None \
+    for no limit
+    :param decimation: the method used to reduce the series to the \
+    resolution of the plot area before drawing; one of 'minmax' \
+    (keeps the extremes of each pixel column, so spikes stay \
+    visible), 'lttb' (Largest-Triangle-Three-Buckets) or None
+    """
+
+    chunk_size = 10000
+    decimation_methods = ("minmax", "lttb", None)
+
+    def __init__(
+        self,
+        graph,
+        name: str,
+        color: str = "black",
+        width: int = 1,
+        maxlen: int = None,
+        decimation: str = "minmax",
+    ):
+        if decimation not in self.decimation_methods:
+            raise ValueError(
+                "decimation must be one of {}".format(self.decimation_methods)
+            )
+
+        self._graph = graph
+        self.name = name
+        self.color = color
+        self.width = width
+        self.maxlen = maxlen
+        self.decimation = decimation
+        self._sorted = True
+        self._grid = None
+
+        if maxlen is None and graph.window is None:
+            self.points = []
+            self._pyramid = _MinMaxPyramid(self.points)
+        else:
+            self.points = deque(maxlen=maxlen)
+            self._pyramid = None
+        self._items = []
+
+        # the y range of the points, brought up to date when it is
+        # needed: _added counts the points added to the series, _seen
+        # those accounted for by the extrema
+        self._extrema = _RunningExtrema(sliding=isinstance(self.points, deque))
+        self._added = 0
+        self._seen = 0
+        self._array_range = None
+
+        # the statistics overlay, if shown; see show_stats
+        self._stats = None
+        self._stats_style = None
+        self._stats_items = {}
+
+        # the x range the items were last rendered for, and whether
+        # the rendered points were a reduction of the series
+        self._window = None
+        self._reduced = False
+
+        # the latest background render requested, and whether it is
+        # yet to be applied
+        self._generation = 0
+        self._pending = False
+
+        # set once the series is removed from its graph
+        self._removed = False
+
+    @property
+    def tag(self):
+        """
+        The canvas tag shared by all items of this series
+        """
+        return "{}series:{}".format(self._graph._prefix, self.name)
+
+    def __len__(self):
+        return len(self.points)
+
+    def append(self, x, y):
+        """
+        Adds a single point to the end of the series and redraws it
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: None
+        """
+        self._check_attached()
+        self._as_list()
+        self.points.append((x, y))
+        self._index(1)
+        self._changed()
+
+    def extend(self, points):
+        """
+        Adds points to the end of the series and redraws it
+
+        :param points: an iterable of (x, y) tuples
+        :return: None
+        """
+        self._check_attached()
+        self._as_list()
+        points = [(x, y) for x, y in points]
+        self.points.extend(points)
+        self._index(len(points))
+        self._changed()
+
+    def set_data(self, x, y):
+        """
+        Replaces the points of the series with the values of two \
+        sequences, typically NumPy arrays or ``array.array('d')`` \
+        buffers.::
+
+            series.set_data(numpy.arange(1000), samples)
+
+        The arrays are not converted to a list of points; when NumPy \
+        is installed they are cropped, decimated and transformed into \
+        canvas coordinates using vectorized operations.
+
+        :param x: the x values, in ascending order
+        :param y: the y values
+        :return: None
+        """
+        self._check_attached()
+        if len(x) != len(y):
+            raise ValueError("x and y must be the same length")
+
+        if isinstance(self.points, deque):
+            # bounded series keep their points in a ring buffer
+            self.points.clear()
+            self.points.extend(zip(x, y))
+            self._sorted = True
+            self._index(len(self.points))
+        else:
+            if np is not None:
+                x = np.asarray(x, dtype=float)
+                y = np.asarray(y, dtype=float)
+                self._sorted = len(x) < 2 or bool(np.all(x[1:] >= x[:-1]))
+            else:
+                self._sorted = all(a <= b for a, b in zip(x, islice(x, 1, None)))
+
+            self.points = _ArrayPoints(x, y)
+            self._pyramid = None
+            self._grid = None
+            self._added = self._seen = 0
+            self._extrema.clear()
+            self._array_range = None
+
+            if self._stats is not None:
+                self._stats.clear()
+                self._stats.push(self.points)
+
+        self._changed()
+
+    def map_file(
+        self, path: str, dtype: str = "float64", x_path: str = None, offset: int = 0
+    ):
+        """
+        Replaces the points of the series with values mapped from \
+        binary files, such as raw captures much larger than memory.::
+
+            series.map_file("capture.f32", dtype="float32")
+
+        The files are memory-mapped rather than loaded: each render \
+        finds the visible window with a binary search on x and reads \
+        only that window, reducing it column by column with min/max \
+        decimation as it is read.
+
+        The x values must be in ascending order; this is not checked, \
+        since checking would mean reading the whole file.
+
+        :param path: a file of interleaved x and y values (x0, y0, x1, \
+        y1, ...), or of y values only when ``x_path`` is given
+        :param dtype: the type of the values, such as 'float32' or \
+        '>f8'; without NumPy only 'float32' and 'float64' in native \
+        byte order are supported
+        :param x_path: a file holding the x values, in the same type \
+        and with the same header size as ``path``
+        :param offset: the number of bytes before the first value of \
+        each file, such as the size of a file header
+        :return: None
+        """
+        self._check_attached()
+        if isinstance(self.points, deque):
+            raise ValueError("files cannot be mapped into a bounded series")
+        if self._stats is not None:
+            raise ValueError("files cannot be mapped into a series showing statistics")
+
+        y = _map_file(path, dtype, offset)
+        if x_path is None:
+            if len(y) % 2:
+                raise ValueError("interleaved files must hold x and y pairs")
+            x, y = y[0::2], y[1::2]
+        else:
+            x = _map_file(x_path, dtype, offset)
+
+        self.points = _MappedPoints(x, y)
+        self._sorted = True
+        self._pyramid = None
+        self._grid = None
+        self._added = self._seen = 0
+        self._extrema.clear()
+        self._array_range = None
+
+        self._changed()
+
+    def _as_list(self):
+        """
+        Converts array data given to :meth:`set_data` into a list of \
+        points so that points may be appended to it
+
+        :return: None
+        """
+        if isinstance(self.points, _MappedPoints):
+            raise ValueError("points cannot be added to a series mapped from a file")
+
+        if isinstance(self.points, _ArrayPoints):
+            self.points = [(float(x), float(y)) for x, y in self.points]
+            self._pyramid = _MinMaxPyramid(self.points) if self._sorted else None
+            self._added = len(self.points)
+
+    def _changed(self):
+        """
+        Brings the canvas up to date after points were added.  In \
+        strip chart mode the graph scrolls and redraws all series once \
+        per idle cycle, however many points arrived in the meantime.
+
+        :return: None
+        """
+        graph = self._graph
+
+        if graph.window is None:
+            if graph.autoscale:
+                graph._autoscale()
+            self.redraw()
+        else:
+            graph._schedule_scroll()
+
+    def _trim(self, x_min: float):
+        """
+        Discards points which have scrolled off the left of the graph, \
+        keeping the last of them so that the line reaches the edge
+
+        :param x_min: the x minimum of the graph
+        :return: None
+        """
+        points = self.points
+        while len(points) > 1 and points[1][0] <= x_min:
+            points.popleft()
+
+        if self._stats is not None:
+            self._stats.trim(x_min)
+
+    def clear(self):
+        """
+        Removes all points from the series, keeping the series itself
+
+        :return: None
+        """
+        self._check_attached()
+        if isinstance(self.points, _ArrayPoints):
+            self.points = []
+        self.points.clear()
+        self._sorted = True
+        self._grid = None
+        self._added = self._seen = 0
+        self._extrema.clear()
+        if self._stats is not None:
+            self._stats.clear()
+        if not isinstance(self.points, deque):
+            self._pyramid = _MinMaxPyramid(self.points)
+        self.redraw()
+
+    def _index(self, added: int):
+        """
+        Updates the indexes of the series for the last ``added`` points: \
+        whether the points are in ascending x order, and the \
+        level-of-detail index.  The level-of-detail index is discarded \
+        if the points are not in ascending x order, since it can only be \
+        searched by x.
+
+        :param added: the number of points just added to the series
+        :return: None
+        """
+        points = self.points
+        start = max(len(points) - added, 0)
+        self._grid = None
+        self._added += added
+
+        if self._stats is not None:
+            if start == 0:
+                self._stats.clear()
+            self._stats.push(_tail(points, len(points) - start))
+
+        if self._sorted:
+            previous = points[start - 1][0] if start else float("-inf")
+
+            for x, _ in _tail(points, len(points) - start):
+                if x < previous:
+                    self._sorted = False
+                    break
+                previous = x
+
+        if not self._sorted:
+            self._pyramid = None
+        if self._pyramid is None:
+            return
+
+        if start == 0:
+            self._pyramid.rebuild()
+        else:
+            for i in range(start, len(points)):
+                self._pyramid.add(i)
+
+    def _y_range(self):
+        """
+        Returns the range of the y values of the series
+
+        :return: a tuple of (y_min, y_max), or None if the series is empty
+        """
+        points = self.points
+        if not len(points):
+            return None
+
+        if isinstance(points, _ArrayPoints):
+            if self._array_range is None:
+                if np is not None:
+                    self._array_range = float(np.min(points.y)), float(np.max(points.y))
+                else:
+                    self._array_range = min(points.y), max(points.y)
+            return self._array_range
+
+        # the points which remain from those already seen are at the
+        # front; any others left the ring buffer or strip chart
+        extrema = self._extrema
+        new = self._added - self._seen
+        if new >= len(points):
+            extrema.clear()
+            extrema.push(y for _, y in points)
+        else:
+            extrema.drop(extrema.count - (len(points) - new))
+            extrema.push(y for _, y in _tail(points, new))
+        self._seen = self._added
+
+        return extrema.min, extrema.max
+
+    def nearest(self, x: float, y: float = None):
+        """
+        Finds the point of the series nearest to the given position.  \
+        Series in ascending x order are searched by x alone using a \
+        binary search; other series (such as scatter data) are searched \
+        by distance on screen using a grid index, in which case ``y`` \
+        must be supplied.
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: the nearest (x, y) point, or None if the series is empty
+        """
+        points = self.points
+        if not points:
+            return None
+
+        if self._sorted:
+            if isinstance(points, _ArrayPoints):
+                if np is not None:
+                    i = int(np.searchsorted(points.x, x))
+                else:
+                    i = bisect_left(points.x, x)
+            else:
+                i = bisect_left(points, x, key=_x_of)
+
+            candidates = [points[j] for j in (i - 1, i) if 0 <= j < len(points)]
+            return min(candidates, key=lambda point: abs(point[0] - x))
+
+        if y is None:
+            raise ValueError("y is required to search unordered series")
+
+        graph = self._graph
+        x_scale = graph.px_x / graph.x_tick
+        y_scale = graph.px_y / graph.y_tick
+        if self._grid is None:
+            self._grid = _GridIndex(points, x_scale, y_scale)
+
+        return self._grid.nearest(x, y, x_scale, y_scale)
+
+    def show_stats(
+        self,
+        mean: bool = True,
+        deviations: float = 2.0,
+        envelope: int = None,
+        alpha: float = None,
+        color: str = None,
+    ):
+        """
+        Overlays running statistics on the series.::
+
+            series.show_stats(deviations=3.0, envelope=50, alpha=0.05)
+
+        The statistics are updated point by point as points arrive, \
+        rather than recalculated over the whole series, and each \
+        overlay is a single canvas item which is updated in place.
+
+        :param mean: True to draw the running mean as a line
+        :param deviations: the number of standard deviations either \
+        side of the mean covered by a shaded band, or None for no band
+        :param envelope: the number of points over which the minimum \
+        and maximum are taken for an outline around the series, or \
+        None for no envelope
+        :param alpha: the weight of each new point, between 0 and 1, for \
+        exponentially weighted statistics which follow the recent \
+        points; None for statistics over all points of the series
+        :param color: the color of the overlays; the color of the \
+        series if None
+        :return: None
+        """
+        self._check_attached()
+        if alpha is not None and not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be greater than 0 and at most 1")
+        if envelope is not None and envelope < 1:
+            raise ValueError("envelope must be at least 1")
+        if isinstance(self.points, _MappedPoints):
+            raise ValueError("statistics are not available for mapped files")
+
+        self.hide_stats()
+
+        self._stats = _StreamStats(
+            alpha,
+            envelope,
+            bounded=isinstance(self.points, deque),
+            maxlen=self.maxlen,
+        )
+        self._stats.push(self.points)
+        self._stats_style = (mean, deviations, envelope, color or self.color)
+        self._draw_stats()
+
+    def hide_stats(self):
+        """
+        Removes the statistics overlays from the series
+
+        :return: None
+        """
+        for item in self._stats_items.values():
+            self._graph.canvas.delete(item)
+        self._stats_items.clear()
+        self._stats = None
+
+    def _draw_stats(self):
+        """
+        Updates the statistics overlays for the current x range of the \
+        graph.  Large series are cropped to the render window and \
+        sampled at about one point per pixel column.
+
+        :return: None
+        """
+        stats = self._stats.points
+        x_min, x_max, columns = self._render_window()
+
+        if self.decimation is not None and len(stats) > 2 * columns:
+            if isinstance(stats, list):
+                start = max(bisect_left(stats, x_min, key=_x_of) - 1, 0)
+                end = bisect_right(stats, x_max, key=_x_of) + 1
+                stats = stats[start:end]
+            sampled = list(stats)[:: max(len(stats) // columns, 1)]
+            if sampled[-1] is not stats[-1]:
+                sampled.append(stats[-1])
+            stats = sampled
+
+        mean, deviations, envelope, color = self._stats_style
+        shapes = {}
+
+        if len(stats) > 1:
+            # transform each column of the statistics once, then
+            # interleave x and y pixel values into flat coordinate lists
+            x_scale, x_offset, y_scale, y_offset = self._graph._view()
+            xs, means, spreads, lows, highs = zip(*stats)
+            xs = [x_offset + x * x_scale for x in xs]
+            means = [y_offset - m * y_scale for m in means]
+
+            if deviations is not None:
+                k = deviations * y_scale
+                upper = [m - k * d for m, d in zip(means, spreads)]
+                lower = [m + k * d for m, d in zip(means, spreads)]
+                shapes["band"] = _interleave(xs + xs[::-1], upper + lower[::-1])
+            if envelope is not None:
+                highs = [y_offset - y * y_scale for y in highs]
+                lows = [y_offset - y * y_scale for y in lows]
+                shapes["envelope"] = _interleave(xs + xs[::-1], highs + lows[::-1])
+            if mean:
+                shapes["mean"] = _interleave(xs, means)
+
+        canvas = self._graph.canvas
+        tags = self._graph._tags("series", "line") + (self.tag,)
+
+        for kind in list(self._stats_items):
+            if kind not in shapes:
+                canvas.delete(self._stats_items.pop(kind))
+        created = len(self._stats_items)
+
+        for kind, coords in shapes.items():
+            item = self._stats_items.get(kind)
+            if item is not None:
+                canvas.coords(item, coords)
+            elif kind == "band":
+                item = canvas.create_polygon(
+                    coords, fill=color, stipple="gray25", outline="", tags=tags
+                )
+                # the band is kept behind the series
+                if self._items:
+                    canvas.tag_lower(item, self._items[0])
+            elif kind == "envelope":
+                item = canvas.create_polygon(coords, fill="", outline=color, tags=tags)
+            else:
+                item = canvas.create_line(coords, fill=color, dash=(4, 2), tags=tags)
+            self._stats_items[kind] = item
+
+        if len(self._stats_items) > created:
+            self._graph._raise_axes()
+
+    def _render_window(self):
+        """
+        Determines the x range to render the series for: the current x \
+        range of the graph with one extra plot width on either side, so \
+        that the graph can be panned by up to a full width without \
+        re-rendering the series.
+
+        :return: a tuple of (x_min, x_max, columns)
+        """
+        graph = self._graph
+        span = graph.x_max - graph.x_min
+
+        columns = 3 * int(graph._x1 - graph._x0)
+
+        return graph.x_min - span, graph.x_max + span, columns
+
+    def _prepare(self):
+        """
+        The first stage of rendering, which runs in the Tk thread: \
+        captures the render window, the transform of the graph and the \
+        points to draw.  Points decimated by 'minmax' are reduced using \
+        the level-of-detail index where there is one, and other \
+        decimated points are cropped to the window; on threaded graphs, points \
+        held in a list or ring buffer which may still grow are copied.
+
+        :return: a function of no arguments which performs the second \
+        stage, see :meth:`_compute`
+        """
+        graph = self._graph
+        x_min, x_max, columns = self._render_window()
+        view = graph._view()
+        points = self.points
+        count = len(points)
+
+        if np is not None and isinstance(points, _ArrayPoints) and self._sorted:
+            # set_data replaces the arrays rather than modifying them
+            return partial(
+                self._compute_arrays,
+                points.x,
+                points.y,
+                count,
+                x_min,
+                x_max,
+                columns,
+                view,
+            )
+
+        if self.decimation == "minmax" and self._pyramid is not None:
+            points = self._pyramid.window(x_min, x_max, columns)
+        elif isinstance(points, _ArrayPoints) and self._sorted:
+            # crop by binary search so that mapped files are only read
+            # within the window
+            start = max(bisect_left(points.x, x_min) - 1, 0)
+            end = min(bisect_right(points.x, x_max) + 1, count)
+            points = points[start:end]
+        elif self.decimation is not None and isinstance(points, list) and self._sorted:
+            # the pyramid only keeps the extremes of each bucket, which
+            # would leave LTTB nothing to choose from
+            start = max(bisect_left(points, x_min, key=_x_of) - 1, 0)
+            end = min(bisect_right(points, x_max, key=_x_of) + 1, count)
+            points = points[start:end]
+        elif graph.threaded and not isinstance(points, _ArrayPoints):
+            points = list(points)
+
+        return partial(self._compute, points, count, x_min, x_max, columns, view)
+
+    def _compute(self, points, count, x_min, x_max, columns, view):
+        """
+        The second stage of rendering, which touches neither the canvas \
+        nor the stored points and so may run in a worker thread: reduces \
+        the points to the resolution of the plot area and transforms \
+        them into canvas coordinates.
+
+        :param points: the points captured by :meth:`_prepare`
+        :param count: the number of points in the series
+        :param x_min: the lowest x value to be drawn
+        :param x_max: the highest x value to be drawn
+        :param columns: the number of pixel columns between x_min and x_max
+        :param view: the transform of the graph, see :meth:`Graph._view`
+        :return: a tuple of the flat coordinate list, the (x_min, x_max) \
+        window rendered and whether the points were reduced
+        """
+        points = self._graph._decimate(points, self.decimation, x_min, x_max, columns)
+
+        return _to_coords(points, view), (x_min, x_max), len(points) < count
+
+    def _compute_arrays(self, x, y, count, x_min, x_max, columns, view):
+        """
+        The NumPy equivalent of :meth:`_compute` for series whose data \
+        was given to :meth:`set_data` in ascending x order.
+        """
+        limits = np.array([x_min, x_max]).astype(x.dtype)
+        start = max(int(np.searchsorted(x, limits[0], side="left")) - 1, 0)
+        end = min(int(np.searchsorted(x, limits[1], side="right")) + 1, len(x))
+        x, y = x[start:end], y[start:end]
+
+        if self.decimation == "minmax":
+            x, y = _decimate_minmax_arrays(x, y, x_min, x_max, columns)
+        elif self.decimation == "lttb" and len(x) > 2 * columns:
+            x, y = np.array(_decimate_lttb(list(zip(x, y)), 2 * columns)).T
+
+        return _to_coords_arrays(x, y, view), (x_min, x_max), len(x) < count
+
+    def _coords(self):
+        """
+        Returns the flat list of canvas coordinates of the series for \
+        the current x range of the graph
+
+        :return: a list [x0, y0, x1, y1, ...] in pixels
+        """
+        coords, self._window, self._reduced = self._prepare()()
+
+        return coords
+
+    def _covers(self, x_min: float, x_max: float):
+        """
+        Determines whether the items already on the canvas can simply \
+        be moved and scaled to show the given x range, or whether the \
+        series must be rendered again at a different level of detail.
+
+        :param x_min: the new x minimum of the graph
+        :param x_max: the new x maximum of the graph
+        :return: True if the existing items may be transformed
+        """
+        if not self._reduced:
+            return True
+
+        lo, hi = self._window
+        ratio = 3 * (x_max - x_min) / (hi - lo)
+
+        return lo <= x_min and x_max <= hi and 0.5 <= ratio <= 2.0
+
+    def redraw(self):
+        """
+        Re-renders the series from its stored points, re-using the \
+        existing canvas items wherever possible.  On graphs created with \
+        ``threaded=True`` the coordinates are computed in a worker \
+        thread and applied to the canvas once they are ready.
+
+        :return: None
+        """
+        self._check_attached()
+        job = self._prepare()
+
+        if self._stats is not None:
+            self._draw_stats()
+
+        if self._graph.threaded:
+            self._graph._submit(self, job)
+        else:
+            self._apply(*job())
+
+    def _apply(self, coords, window, reduced):
+        """
+        Updates the canvas items of the series with rendered coordinates
+
+        :param coords: a flat list [x0, y0, x1, y1, ...] in pixels
+        :param window: the (x_min, x_max) range the coordinates cover
+        :param reduced: True if the coordinates are a reduction of the \
+        series
+        :return: None
+        """
+        self._window, self._reduced = window, reduced
+        canvas = self._graph.canvas
+
+        # consecutive chunks share their boundary point so that the
+        # polyline is continuous across items
+        step = 2 * (self.chunk_size - 1)
+        chunks = [coords[i : i + step + 2] for i in range(0, len(coords) - 2, step)]
+
+        created = len(chunks) > len(self._items)
+
+        for i, chunk in enumerate(chunks):
+            if i < len(self._items):
+                canvas.coords(self._items[i], chunk)
+            else:
+                self._items.append(
+                    canvas.create_line(
+                        chunk,
+                        fill=self.color,
+                        width=self.width,
+                        tags=self._graph._tags("series", "line") + (self.tag,),
+                    )
+                )
+
+        for item in self._items[len(chunks) :]:
+            canvas.delete(item)
+        del self._items[len(chunks) :]
+
+        if created:
+            self._graph._raise_axes()
+
+    def delete(self):
+        """
+        Removes the series from the graph.  The series cannot be \
+        changed afterwards.
+
+        :return: None
+        """
+        self._graph.canvas.delete(self.tag)
+        self._graph._series.pop(self.name, None)
+        self._detach()
+
+    def _detach(self):
+        """
+        Forgets the canvas items and points of a series removed from \
+        its graph, whose items have been deleted.  Later changes to the \
+        series raise ValueError rather than drawing on deleted items.
+        """
+        self._items.clear()
+        self._stats_items.clear()
+        self._stats = None
+        self.points = []
+        self._pyramid = None
+        self._grid = None
+        self._pending = False
+        self._removed = True
+
+    def _check_attached(self):
+        if self._removed:
+            raise ValueError(
+                "the series '{}' has been removed from its graph".format(self.name)
+            )
+
+
+class ScatterSeries(Series):
+    """
+    A series drawn as a raster image of the plot area rather than as \
+    a line.  The points are counted per pixel and the image is written \
+    with one ``PhotoImage.put`` per run of occupied pixels, so a scatter \
+    of any number of points is a single canvas item.  Pixels without \
+    points are left transparent, so that other series show through.  \
+    Scatter series are normally created by :meth:`Graph.plot_scatter`.
+
+    :param graph: the :class:`Graph` on which the series is drawn
+    :param name: the name of the series
+    :param color: the color of the points
+    :param maxlen: the maximum number of points retained, or None \
+    for no limit
+    :param density: True to shade each pixel by the number of points \
+    which fall within it, from the background color (no points) to \
+    ``color`` (the most points)
+    """
+
+    def __init__(
+        self,
+        graph,
+        name: str,
+        color: str = "black",
+        maxlen: int = None,
+        density: bool = False,
+    ):
+        super().__init__(graph, name, color=color, maxlen=maxlen, decimation=None)
+
+        self.density = density
+        self.counts = []
+        self._image = None
+
+    def _covers(self, x_min: float, x_max: float):
+        # the image cannot be scaled on the canvas
+        return False
+
+    def _count(self, width: int, height: int):
+        """
+        Counts the points falling within each pixel of the plot area
+
+        :param width: the width of the plot area in pixels
+        :param height: the height of the plot area in pixels
+        :return: a flat list of counts, row by row
+        """
+        graph = self._graph
+        points = self.points
+
+        if np is not None and isinstance(points, _ArrayPoints):
+            x_scale = graph.px_x / graph.x_tick
+            y_scale = graph.px_y / graph.y_tick
+            columns = np.floor((points.x - graph.x_min) * x_scale).astype(int)
+            rows = np.floor((graph.y_max - points.y) * y_scale).astype(int)
+            inside = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+            pixels = rows[inside] * width + columns[inside]
+
+            return np.bincount(pixels, minlength=width * height).tolist()
+
+        counts = [0] * (width * height)
+        coords = graph._to_canvas(points)
+        for px, py in zip(coords[0::2], coords[1::2]):
+            column, row = math.floor(px - graph._x0), math.floor(py - graph._y0)
+            if 0 <= column < width and 0 <= row < height:
+                counts[row * width + column] += 1
+
+        return counts
+
+    def _palette(self, levels: int):
+        """
+        Returns a list of ``levels`` colors running from the background \
+        of the canvas to the color of the series
+        """
+        canvas = self._graph.canvas
+        r0, g0, b0 = (c >> 8 for c in canvas.winfo_rgb(canvas.cget("background")))
+        r1, g1, b1 = (c >> 8 for c in canvas.winfo_rgb(self.color))
+
+        palette = []
+        for level in range(levels):
+            f = level / (levels - 1)
+            palette.append(
+                "#{:02x}{:02x}{:02x}".format(
+                    round(r0 + (r1 - r0) * f),
+                    round(g0 + (g1 - g0) * f),
+                    round(b0 + (b1 - b0) * f),
+                )
+            )
+
+        return palette
+
+    def redraw(self):
+        """
+        Re-renders the image of the series from its stored points
+
+        :return: None
+        """
+        self._check_attached()
+        graph = self._graph
+        canvas = graph.canvas
+        width, height = int(graph._x1 - graph._x0), int(graph._y1 - graph._y0)
+
+        self.counts = self._count(width, height)
+
+        if self.density:
+            palette = self._palette(256)
+            scale = 255 / math.log1p(max(self.counts, default=0) or 1)
+            # rounding can take the most populated pixel just past the
+            # last level
+            pixels = [
+                palette[min(round(math.log1p(c) * scale), 255)] if c else None
+                for c in self.counts
+            ]
+        else:
+            _, color = self._palette(2)
+            pixels = [color if c else None for c in self.counts]
+
+        if self._image is None or (self._image.width(), self._image.height()) != (
+            width,
+            height,
+        ):
+            self._image = tk.PhotoImage(master=canvas, width=width, height=height)
+        else:
+            self._image.blank()
+
+        # write only the runs of occupied pixels; the rest of the image
+        # stays transparent
+        for row in range(height):
+            column = 0
+            runs = groupby(
+                pixels[row * width : (row + 1) * width], lambda pixel: pixel is None
+            )
+            for empty, run in runs:
+                run = list(run)
+                if not empty:
+                    self._image.put("{" + " ".join(run) + "}", to=(column, row))
+                column += len(run)
+
+        if self._items:
+            canvas.coords(self._items[0], graph._x0, graph._y0)
+            canvas.itemconfigure(self._items[0], image=self._image)
+        else:
+            self._items.append(
+                canvas.create_image(
+                    graph._x0,
+                    graph._y0,
+                    image=self._image,
+                    anchor="nw",
+                    tags=graph._tags("series") + (self.tag,),
+                )
+            )
+            # keep the scatter behind the other series
+            canvas.tag_lower(self._items[0])
+
+
+class SeriesLoader:
+    """
+    Loads points from a file into a :class:`Series` without blocking \
+    the event loop.  Loaders are normally created by \
+    :meth:`Graph.load_csv` or :meth:`Graph.load_binary`.::
+
+        loader = graph.load_csv("log.csv", skip_rows=1,
+                                progress=lambda f: print(round(100 * f)))
+        loader.cancel()
+
+    The file is parsed in chunks in a worker thread.  Every \
+    ``poll_ms`` the Tk thread appends whatever chunks have arrived to \
+    the series in one go, so the graph fills in progressively.  The \
+    worker waits while too many parsed chunks are waiting to be drawn.
+
+    :param series: the :class:`Series` to load the points into
+    :param path: the path of the file
+    :param read: a function of the file, opened in binary mode, which \
+    yields lists of (x, y) tuples
+    :param progress: a function called in the Tk thread with the \
+    fraction of the file loaded, from 0.0 to 1.0, after each batch \
+    of points is drawn
+    :param done: a function called in the Tk thread with the loader \
+    once loading finishes or is cancelled
+    :param poll_ms: the interval between batches in milliseconds
+    """
+
+    def __init__(
+        self,
+        series,
+        path: str,
+        read,
+        progress: callable = None,
+        done: callable = None,
+        poll_ms: int = 50,
+    ):
+        self.series = series
+        self.path = path
+        self.fraction = 0.0
+        self.finished = False
+        self.cancelled = False
+
+        self._progress = progress
+        self._done = done
+        self._poll_ms = poll_ms
+        self._size = os.path.getsize(path)
+
+        self._chunks = queue.Queue(maxsize=16)
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._read, args=(read,), daemon=True)
+        self._worker.start()
+
+        self._poll_id = series._graph.after(self._poll_ms, self._poll)
+        series._graph._loaders.append(self)
+
+    def cancel(self):
+        """
+        Stops loading.  The points loaded so far remain in the series.
+
+        :return: None
+        """
+        if self.finished:
+            return
+
+        self._stop.set()
+        self.series._graph.after_cancel(self._poll_id)
+        self.cancelled = True
+        self._finish()
+
+    def _read(self, read):
+        """
+        The worker thread: parses the file and hands each chunk, with \
+        the position reached in the file, to the Tk thread.  None marks \
+        the end of the file; an exception is handed over to be raised \
+        in the Tk thread.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                for points in read(f):
+                    if not self._put((points, f.tell())):
+                        return
+        except Exception as e:
+            self._put((e, None))
+            return
+
+        self._put((None, self._size))
+
+    def _put(self, item):
+        """
+        Hands an item to the Tk thread, waiting while the queue is full
+
+        :return: False if loading was cancelled in the meantime
+        """
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _poll(self):
+        """
+        Appends the chunks which have arrived to the series
+        """
+        points = []
+        position = None
+        error = None
+        end = False
+
+        while True:
+            try:
+                chunk, chunk_position = self._chunks.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(chunk, Exception):
+                error = chunk
+                break
+            if chunk is None:
+                end = True
+            else:
+                points.extend(chunk)
+            position = chunk_position
+
+        if points:
+            self.series.extend(points)
+
+        if position is not None:
+            self.fraction = position / self._size if self._size else 1.0
+            if self._progress is not None:
+                self._progress(self.fraction)
+
+        if error is not None or end:
+            self._finish()
+            if error is not None:
+                raise error
+        else:
+            self._poll_id = self.series._graph.after(self._poll_ms, self._poll)
+
+    def _finish(self):
+        self.finished = True
+        self.series._graph._loaders.remove(self)
+        if self._done is not None:
+            self._done(self)
+
+
+def _unbind(widget, sequence: str, funcid: str):
+    """
+    Removes one callback bound to an event with ``add="+"``, leaving any \
+    others bound to the same event.  Before Python 3.13, \
+    ``Misc.unbind`` removes every callback of the event.
+
+    :param widget: the widget
+    :param sequence: the event sequence, such as '<Motion>'
+    :param funcid: the identifier returned by ``bind``
+    :return: None
+    """
+    # each callback is one line of the script, calling "[funcid ..."
+    call = "[{} ".format(funcid)
+    script = widget.bind(sequence)
+    lines = [line for line in script.split("\n") if call not in line]
+    widget.bind(sequence, "\n".join(lines))
+    widget.deletecommand(funcid)
+
+
+class Graph(tk.Frame):
+    """
+    Tkinter native graph (pretty basic, but doesn't require heavy install).::
+
+        graph = tk_tools.Graph(
+            parent=root,
+            x_min=-1.0,
+            x_max=1.0,
+            y_min=0.0,
+            y_max=2.0,
+            x_tick=0.2,
+            y_tick=0.2,
+            width=500,
+            height=400
+        )
+
+        graph.grid(row=0, column=0)
+
+        # create an initial line
+        line_0 = [(x/10, x/10) for x in range(10)]
+        series = graph.plot_line(line_0)
+
+    :param parent: the parent frame
+    :param x_min: the x minimum
+    :param x_max: the x maximum
+    :param y_min: the y minimum
+    :param y_max: the y maximum
+    :param x_tick: the 'tick' on the x-axis
+    :param y_tick: the 'tick' on the y-axis
+    :param window: when given, the graph acts as a strip chart: the \
+    x-axis is a sliding window of this width which follows the \
+    newest point of any series, and points which leave the window \
+    are discarded
+    :param threaded: True to decimate and transform series in a pool \
+    of worker threads, so that rendering very large series does not \
+    block the event loop.  Finished renders are applied to the canvas \
+    from the Tk thread, and renders superseded by a newer one are \
+    dropped.
+    :param autoscale: True to fit the y-axis to the data as points \
+    arrive.  The range of each series is kept up to date as points are \
+    added and removed, and the axis is only rescaled when the data \
+    leaves it or shrinks well within it, so that a streaming chart \
+    does not redraw its axes for every point.
+    :param autoscale_margin: the space left above and below the data \
+    when the y-axis is rescaled, as a fraction of the data range
+    :param options: additional valid tkinter.canvas options
+    """
+
+    # graphs sharing a canvas prefix the tags of their items
+    _prefix = ""
+    _x_labels = True
+
+    # the worker threads shared by all threaded graphs, and how often
+    # the Tk thread checks them for finished renders
+    _executor = None
+    _poll_ms = 10
+
+    def __init__(
+        self,
+        parent,
+        x_min: float,
+        x_max: float,
+        y_min: float,
+        y_max: float,
+        x_tick: float,
+        y_tick: float,
+        window: float = None,
+        threaded: bool = False,
+        autoscale: bool = False,
+        autoscale_margin: float = 0.25,
+        **options
+    ):
+        self._parent = parent
+        super().__init__(self._parent, **options)
+
+        if window is not None and window <= 0:
+            raise ValueError("window must be greater than zero")
+
+        self.canvas = self._create_canvas()
+
+        self.w = float(self.canvas.config("width")[4])
+        self.h = float(self.canvas.config("height")[4])
+        self._x0, self._y0, self._x1, self._y1 = self._layout()
+        self.x_min = x_min
+        self.x_max = x_max
+        self.x_tick = x_tick
+        self.y_min = y_min
+        self.y_max = y_max
+        self.y_tick = y_tick
+        self.px_x = (self._x1 - self._x0) / ((x_max - x_min) / x_tick)
+        self.px_y = (self._y1 - self._y0) / ((y_max - y_min) / y_tick)
+
+        self.window = window
+        self._scroll_pending = None
+
+        self.threaded = threaded
+        self._results = queue.Queue()
+        self._collect_pending = None
+        self._loaders = []
+
+        if autoscale_margin < 0:
+            raise ValueError("autoscale_margin must not be negative")
+
+        self.autoscale = autoscale
+        self.autoscale_margin = autoscale_margin
+        self._y_intervals = max(round((y_max - y_min) / y_tick), 1)
+
+        self._crosshair = None
+        self._crosshair_pending = None
+        self._crosshair_bindings = []
+        self._pointer = None
+
+        self._series = {}
+        self._series_count = 0
+        self._axes_key = None
+
+        self.draw_axes()
+
+    def _create_canvas(self):
+        """
+        Creates the canvas on which the graph is drawn
+
+        :return: the canvas
+        """
+        canvas = tk.Canvas(self)
+        canvas.grid(row=0, column=0)
+
+        return canvas
+
+    def _layout(self):
+        """
+        Determines the plot area of the graph on the canvas, leaving \
+        room around it for the axes labels
+
+        :return: the (left, top, right, bottom) of the plot area in pixels
+        """
+        return 50, 50, self.w - 50, self.h - 50
+
+    def _tags(self, *kinds):
+        """
+        Returns the canvas tags for an item of the given kinds.  Items \
+        of graphs which share a canvas with others carry both the plain \
+        tag and one prefixed for the graph.
+
+        :param kinds: tags such as 'series' or 'axes'
+        :return: a tuple of tags
+        """
+        if not self._prefix:
+            return kinds
+        return kinds + tuple(self._prefix + kind for kind in kinds)
+
+    def draw_axes(self):
+        """
+        Removes all existing series and re-draws the axes.  The axes \
+        are only rebuilt if the range or size of the graph has changed \
+        since they were last drawn.
+
+        :return: None
+        """
+        self.clear_series()
+        self._update_axes()
+
+    def clear_series(self):
+        """
+        Removes all existing series and points, leaving the axes in place.  \
+        The removed series cannot be changed afterwards.
+
+        :return: None
+        """
+        self.canvas.delete(self._prefix + "series")
+        for series in self._series.values():
+            series._detach()
+        self._series.clear()
+
+    def _update_axes(self):
+        """
+        Re-draws the axes if the range or size of the graph has changed \
+        since they were last drawn.  Axes items are tagged 'axes' and \
+        kept below all series.
+
+        :return: True if the axes were re-drawn, else False
+        """
+        self.w = float(self.canvas.cget("width"))
+        self.h = float(self.canvas.cget("height"))
+        rect = self._layout()
+
+        key = (
+            self.x_min,
+            self.x_max,
+            self.x_tick,
+            self.y_min,
+            self.y_max,
+            self.y_tick,
+            rect,
+        )
+        if key == self._axes_key:
+            return False
+        self._axes_key = key
+
+        x0, y0, x1, y1 = self._x0, self._y0, self._x1, self._y1 = rect
+        self.px_x = (x1 - x0) / ((self.x_max - self.x_min) / self.x_tick)
+        self.px_y = (y1 - y0) / ((self.y_max - self.y_min) / self.y_tick)
+
+        tags = self._tags("axes")
+        self.canvas.delete(self._prefix + "axes")
+        self.canvas.delete(self._prefix + "mask")
+
+        # the margins are masked so that series drawn beyond the plot
+        # area, such as the parts rendered ahead for panning, are hidden
+        bx0, by0, bx1, by1 = self._band()
+        background = self.canvas.cget("background")
+        for margin in (
+            (bx0, by0, bx1, y0),
+            (bx0, y1, bx1, by1),
+            (bx0, y0, x0, y1),
+            (x1, y0, bx1, y1),
+        ):
+            self.canvas.create_rectangle(
+                margin, fill=background, outline="", tags=self._tags("mask")
+            )
+
+        self.canvas.create_rectangle(
+            rect, outline="black", tags=self._tags("axes", "frame")
+        )
+
+        x_ticks = _tick_layout(self.x_min, self.x_max, self.x_tick, x1 - x0)
+        for x_step, label in x_ticks:
+            coord = x0 + x_step, y1, x0 + x_step, y1 + 5
+            self.canvas.create_line(coord, fill="black", tags=tags)
+
+            if self._x_labels:
+                coord = x0 + x_step, y1 + 10
+                self.canvas.create_text(coord, fill="black", text=label, tags=tags)
+
+        y_ticks = _tick_layout(self.y_min, self.y_max, self.y_tick, y1 - y0)
+        for y_step, label in y_ticks:
+            y_step = y1 - y0 - y_step
+            coord = x0 - 5, y0 + y_step, x0, y0 + y_step
+            self.canvas.create_line(coord, fill="black", tags=tags)
+            coord = x0 - 15, y0 + y_step
+
+            self.canvas.create_text(coord, fill="black", text=label, tags=tags)
+
+        self._raise_axes()
+
+        return True
+
+    def _band(self):
+        """
+        Determines the part of the canvas which belongs to the graph, \
+        within which everything outside of the plot area is masked
+
+        :return: the (left, top, right, bottom) of the band in pixels
+        """
+        return 0, 0, self.w, self.h
+
+    def _raise_axes(self):
+        """
+        Raises the margin masks above all series, and the axes above \
+        the masks.  Called whenever series items are created, since new \
+        items are placed on top.  The masks and axes of every graph \
+        sharing the canvas are raised, as series may extend into the \
+        margins of their neighbours.
+
+        :return: None
+        """
+        self.canvas.tag_raise("mask")
+        self.canvas.tag_raise("axes")
+
+    def plot_point(self, x, y, visible=True, color="black", size=5):
+        """
+        Places a single point on the grid
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :param visible: True if the individual point should be visible
+        :param color: the color of the point
+        :param size: the point size in pixels
+        :return: The absolute coordinates as a tuple
+        """
+        xp = (self.px_x * (x - self.x_min)) / self.x_tick
+        yp = (self.px_y * (self.y_max - y)) / self.y_tick
+        coord = self._x0 + xp, self._y0 + yp
+
+        if visible:
+            self._draw_marker(coord, color, size, tags=self._tags("series", "marker"))
+            self._raise_axes()
+
+        return coord
+
+    def _draw_marker(self, coord, color, size, tags):
+        """
+        Draws the circular marker used to show an individual point
+
+        :param coord: the absolute (x, y) coordinate of the point
+        :param color: the color of the point
+        :param size: the point size in pixels
+        :param tags: the canvas tags to apply to the marker
+        :return: the canvas item id
+        """
+        # divide down to an appropriate size
+        size = int(size / 2) if int(size / 2) > 1 else 1
+        x, y = coord
+
+        return self.canvas.create_oval(
+            x - size, y - size, x + size, y + size, fill=color, tags=tags
+        )
+
+    def _to_canvas(self, points):
+        """
+        Transforms a sequence of (x, y) points into the flat list of \
+        canvas coordinates expected by ``canvas.create_line`` and \
+        ``canvas.coords``.
+
+        :param points: an iterable of (x, y) tuples
+        :return: a flat list [x0, y0, x1, y1, ...] in pixels
+        """
+        return _to_coords(points, self._view())
+
+    def _to_canvas_arrays(self, x, y):
+        """
+        The vectorized equivalent of :meth:`_to_canvas` for NumPy arrays \
+        of x and y values.
+
+        :param x: a NumPy array of x values
+        :param y: a NumPy array of y values
+        :return: a flat list [x0, y0, x1, y1, ...] in pixels
+        """
+        return _to_coords_arrays(x, y, self._view())
+
+    def _view(self):
+        """
+        Returns the transform from x and y values to canvas coordinates, \
+        the same math as :meth:`plot_point`
+
+        :return: a tuple of (x_scale, x_offset, y_scale, y_offset)
+        """
+        x_scale = self.px_x / self.x_tick
+        y_scale = self.px_y / self.y_tick
+
+        return (
+            x_scale,
+            self._x0 - self.x_min * x_scale,
+            y_scale,
+            self._y0 + self.y_max * y_scale,
+        )
+
+    def add_series(
+        self,
+        name: str = None,
+        color="black",
+        width: int = 1,
+        maxlen: int = None,
+        decimation: str = "minmax",
+    ):
+        """
+        Creates a new, empty series to which points may be streamed.::
+
+            series = graph.add_series("sensor", maxlen=500)
+            series.append(0.0, 1.0)
+
+        :param name: the name of the series; a name is generated \
+        if none is supplied
+        :param color: the color of the line
+        :param width: the width of the line in pixels
+        :param maxlen: the number of points retained in the series \
+        ring buffer, or None to retain all points
+        :param decimation: the decimation method, see :class:`Series`
+        :return: the new :class:`Series`
+        """
+        series = Series(
+            self,
+            self._series_name(name),
+            color=color,
+            width=width,
+            maxlen=maxlen,
+            decimation=decimation,
+        )
+        self._series[series.name] = series
+
+        return series
+
+    def _series_name(self, name: str = None):
+        """
+        Generates a name for a new series, or checks that the given \
+        name is not already in use
+
+        :param name: the requested name, or None
+        :return: the name of the new series
+        """
+        if name is None:
+            name = "series{}".format(self._series_count)
+        self._series_count += 1
+
+        if name in self._series:
+            raise ValueError("series '{}' already exists".format(name))
+
+        return name
+
+    def get_series(self, name: str):
+        """
+        Returns the series with the given name
+
+        :param name: the name of the series
+        :return: the :class:`Series`
+        """
+        return self._series[name]
+
+    def _decimate(self, points, method: str, x_min: float, x_max: float, columns: int):
+        """
+        Reduces points to what can be seen in the plot area
+
+        :param points: a sequence of (x, y) tuples sorted by x
+        :param method: the decimation method, see :class:`Series`
+        :param x_min: the lowest x value to be drawn
+        :param x_max: the highest x value to be drawn
+        :param columns: the number of pixel columns between x_min and x_max
+        :return: a sequence of (x, y) tuples
+        """
+        if method == "minmax":
+            return _decimate_minmax(points, x_min, x_max, columns)
+        elif method == "lttb":
+            return _decimate_lttb(points, 2 * columns)
+
+        return points
+
+    def set_xlim(self, x_min: float, x_max: float, x_tick: float = None):
+        """
+        Changes the visible range of the x-axis.  Series are moved and \
+        scaled on the canvas where possible and only re-rendered when \
+        a different level of detail is required.
+
+        :param x_min: the x minimum
+        :param x_max: the x maximum
+        :param x_tick: the 'tick' on the x-axis; unchanged if None
+        :return: None
+        """
+        self._set_limits(
+            x_min, x_max, x_tick or self.x_tick, self.y_min, self.y_max, self.y_tick
+        )
+
+    def set_ylim(self, y_min: float, y_max: float, y_tick: float = None):
+        """
+        Changes the visible range of the y-axis.  Series are moved and \
+        scaled on the canvas rather than re-rendered.
+
+        :param y_min: the y minimum
+        :param y_max: the y maximum
+        :param y_tick: the 'tick' on the y-axis; unchanged if None
+        :return: None
+        """
+        self._set_limits(
+            self.x_min, self.x_max, self.x_tick, y_min, y_max, y_tick or self.y_tick
+        )
+
+    def pan(self, dx: float = 0.0, dy: float = 0.0):
+        """
+        Shifts the visible range of the graph
+
+        :param dx: the distance to shift the x-axis, in x units
+        :param dy: the distance to shift the y-axis, in y units
+        :return: None
+        """
+        self._set_limits(
+            self.x_min + dx,
+            self.x_max + dx,
+            self.x_tick,
+            self.y_min + dy,
+            self.y_max + dy,
+            self.y_tick,
+        )
+
+    def _set_limits(self, x_min, x_max, x_tick, y_min, y_max, y_tick):
+        """
+        Applies a new range to both axes and brings the series on the \
+        canvas up to date using ``canvas.scale`` and ``canvas.move``
+        """
+        if x_max <= x_min or y_max <= y_min:
+            raise ValueError("the maximum of each axis must exceed its minimum")
+
+        x_scale = self.px_x / self.x_tick
+        y_scale = self.px_y / self.y_tick
+        old_x_min, old_y_max = self.x_min, self.y_max
+
+        self.x_min, self.x_max, self.x_tick = x_min, x_max, x_tick
+        self.y_min, self.y_max, self.y_tick = y_min, y_max, y_tick
+        self._update_axes()
+
+        new_x_scale = self.px_x / self.x_tick
+        new_y_scale = self.px_y / self.y_tick
+        kx = new_x_scale / x_scale
+        ky = new_y_scale / y_scale
+        dx = (old_x_min - x_min) * new_x_scale
+        dy = (y_max - old_y_max) * new_y_scale
+
+        self._transform(self._prefix, kx, ky, dx, dy)
+        self._refresh_series(x_min, x_max)
+
+    def _refresh_series(self, x_min: float, x_max: float):
+        """
+        Re-renders the series which cannot be transformed to show the \
+        given x range, and those with a background render pending, \
+        which was computed for the previous range
+
+        :param x_min: the new x minimum of the graph
+        :param x_max: the new x maximum of the graph
+        :return: None
+        """
+        for series in self._series.values():
+            if series._pending or not series._covers(x_min, x_max):
+                series.redraw()
+
+    def _autoscale(self):
+        """
+        Fits the y-axis to the range of all series if the data has left \
+        the axis, or has shrunk to well within it
+
+        :return: None
+        """
+        ranges = [series._y_range() for series in self._series.values()]
+        ranges = [r for r in ranges if r is not None]
+        if not ranges:
+            return
+
+        lo = min(r[0] for r in ranges)
+        hi = max(r[1] for r in ranges)
+        span = (hi - lo) or abs(hi) or 1.0
+        margin = self.autoscale_margin
+
+        inside = self.y_min <= lo and hi <= self.y_max
+        if inside and self.y_max - self.y_min <= (1.0 + 4 * margin) * span:
+            return
+
+        y_min, y_max = lo - margin * span, hi + margin * span
+        if y_max <= y_min:
+            # flat data with no margin would leave the axis no height
+            y_min, y_max = lo - span / 2, hi + span / 2
+
+        self._set_limits(
+            self.x_min,
+            self.x_max,
+            self.x_tick,
+            y_min,
+            y_max,
+            _nice_tick(y_max - y_min, self._y_intervals),
+        )
+
+    def _transform(self, prefix: str, kx: float, ky: float, dx: float, dy: float):
+        """
+        Scales the series items about the top left corner of the plot \
+        area, then moves them
+
+        :param prefix: the prefix of the tags of the items to transform
+        :param kx: the horizontal scale factor
+        :param ky: the vertical scale factor
+        :param dx: the horizontal distance in pixels
+        :param dy: the vertical distance in pixels
+        :return: None
+        """
+        canvas = self.canvas
+
+        if kx != 1.0 or ky != 1.0:
+            canvas.scale(prefix + "line", self._x0, self._y0, kx, ky)
+
+            # markers are re-centered rather than scaled so that they
+            # keep their size
+            for item in canvas.find_withtag(prefix + "marker"):
+                x0, y0, x1, y1 = canvas.coords(item)
+                cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+                canvas.move(
+                    item, (cx - self._x0) * (kx - 1.0), (cy - self._y0) * (ky - 1.0)
+                )
+        if dx or dy:
+            canvas.move(prefix + "series", dx, dy)
+
+    def _from_canvas(self, px: float, py: float):
+        """
+        Converts absolute canvas coordinates to x and y values, the \
+        inverse of :meth:`plot_point`
+
+        :param px: the canvas x coordinate in pixels
+        :param py: the canvas y coordinate in pixels
+        :return: the (x, y) values as a tuple
+        """
+        x = self.x_min + (px - self._x0) * self.x_tick / self.px_x
+        y = self.y_max - (py - self._y0) * self.y_tick / self.px_y
+
+        return x, y
+
+    def nearest(self, x: float, y: float):
+        """
+        Finds the point nearest to the given position across all series, \
+        measuring distance on screen
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: a tuple of (series, (x, y)), or None if there are no points
+        """
+        x_scale = self.px_x / self.x_tick
+        y_scale = self.px_y / self.y_tick
+
+        best, best_distance = None, math.inf
+        for series in self._series.values():
+            point = series.nearest(x, y)
+            if point is None:
+                continue
+
+            distance = math.hypot((point[0] - x) * x_scale, (point[1] - y) * y_scale)
+            if distance < best_distance:
+                best, best_distance = (series, point), distance
+
+        return best
+
+    def show_crosshair(self, color: str = "grey", frame_ms: int = 16):
+        """
+        Shows a crosshair on the point nearest to the mouse pointer, \
+        along with a readout of its value.  Mouse movement is coalesced \
+        so that the crosshair is updated at most once every \
+        ``frame_ms`` milliseconds.
+
+        :param color: the color of the crosshair and readout
+        :param frame_ms: the minimum time between updates in milliseconds
+        :return: None
+        """
+        self.hide_crosshair()
+
+        self._frame_ms = frame_ms
+        self._crosshair = (
+            self.canvas.create_line(
+                0, 0, 0, 0, fill=color, tags=self._tags("crosshair")
+            ),
+            self.canvas.create_line(
+                0, 0, 0, 0, fill=color, tags=self._tags("crosshair")
+            ),
+            self.canvas.create_text(
+                0, 0, fill=color, anchor="sw", text="", tags=self._tags("crosshair")
+            ),
+        )
+        self.canvas.itemconfigure(self._prefix + "crosshair", state="hidden")
+
+        # other callbacks, including the crosshairs of other graphs on
+        # the same canvas, stay bound
+        self._crosshair_bindings = [
+            (sequence, self.canvas.bind(sequence, callback, add="+"))
+            for sequence, callback in (
+                ("<Motion>", self._on_motion),
+                ("<Leave>", self._on_leave),
+            )
+        ]
+
+    def hide_crosshair(self):
+        """
+        Removes the crosshair shown by :meth:`show_crosshair`
+
+        :return: None
+        """
+        if self._crosshair_pending is not None:
+            self.after_cancel(self._crosshair_pending)
+            self._crosshair_pending = None
+
+        for sequence, funcid in self._crosshair_bindings:
+            _unbind(self.canvas, sequence, funcid)
+        self._crosshair_bindings = []
+        self.canvas.delete(self._prefix + "crosshair")
+        self._crosshair = None
+
+    def _on_motion(self, event):
+        self._pointer = event.x, event.y
+        if self._crosshair_pending is None:
+            self._crosshair_pending = self.after(self._frame_ms, self._update_crosshair)
+
+    def _on_leave(self, event):
+        self._pointer = None
+        if self._crosshair_pending is None:
+            self._crosshair_pending = self.after(self._frame_ms, self._update_crosshair)
+
+    def _update_crosshair(self):
+        """
+        Moves the crosshair to the point nearest the last known position \
+        of the mouse pointer
+        """
+        self._crosshair_pending = None
+        if self._crosshair is None:
+            return
+
+        found = None
+        if self._pointer is not None:
+            found = self.nearest(*self._from_canvas(*self._pointer))
+
+        if found is None:
+            self.canvas.itemconfigure(self._prefix + "crosshair", state="hidden")
+            return
+
+        vertical, horizontal, readout = self._crosshair
+        x, y = found[1]
+        px, py = self.plot_point(x, y, visible=False)
+
+        self.canvas.coords(vertical, px, self._y0, px, self._y1)
+        self.canvas.coords(horizontal, self._x0, py, self._x1, py)
+        self.canvas.coords(readout, px + 3, py - 3)
+        self.canvas.itemconfigure(readout, text="({:g}, {:g})".format(x, y))
+        self.canvas.itemconfigure(self._prefix + "crosshair", state="normal")
+        self.canvas.tag_raise(self._prefix + "crosshair")
+
+    def _submit(self, series, job):
+        """
+        Runs the compute stage of a render in a worker thread.  The \
+        result is applied by :meth:`_collect` unless a newer render of \
+        the same series has been submitted in the meantime.
+
+        :param series: the series being rendered
+        :param job: the function returned by :meth:`Series._prepare`
+        :return: None
+        """
+        if Graph._executor is None:
+            Graph._executor = ThreadPoolExecutor(thread_name_prefix="tk_tools")
+
+        series._generation += 1
+        series._pending = True
+        generation = series._generation
+
+        # the worker only hands the result over; Tk is not thread safe
+        future = Graph._executor.submit(job)
+        future.add_done_callback(lambda f: self._results.put((series, generation, f)))
+
+        if self._collect_pending is None:
+            self._collect_pending = self.after(self._poll_ms, self._collect)
+
+    def _collect(self):
+        """
+        Applies finished background renders to the canvas, dropping \
+        those superseded by a newer render or whose series was removed
+        """
+        self._collect_pending = None
+
+        finished = []
+        while True:
+            try:
+                series, generation, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            current = self._series.get(series.name) is series
+            if current and generation == series._generation:
+                series._pending = False
+                finished.append((series, future))
+
+        if any(series._pending for series in self._series.values()):
+            self._collect_pending = self.after(self._poll_ms, self._collect)
+
+        for series, future in finished:
+            series._apply(*future.result())
+
+    def destroy(self):
+        # stop the worker threads still loading into this graph
+        for loader in list(self._loaders):
+            loader.cancel()
+
+        if self._collect_pending is not None:
+            self.after_cancel(self._collect_pending)
+            self._collect_pending = None
+        if self._crosshair_pending is not None:
+            self.after_cancel(self._crosshair_pending)
+            self._crosshair_pending = None
+        if self._scroll_pending is not None:
+            self.after_cancel(self._scroll_pending)
+            self._scroll_pending = None
+
+        super().destroy()
+
+    def _schedule_scroll(self):
+        """
+        Arranges for the strip chart to scroll once the event loop is idle
+        """
+        if self._scroll_pending is None:
+            self._scroll_pending = self.after_idle(self._scroll)
+
+    def _scroll(self):
+        """
+        Moves the strip chart window to the newest point, discards the \
+        points which have left it and redraws each series in place
+        """
+        self._scroll_pending = None
+
+        latest = max(
+            (series.points[-1][0] for series in self._series.values() if series),
+            default=None,
+        )
+        if latest is not None and latest > self.x_max:
+            self.x_min, self.x_max = latest - self.window, latest
+            self._update_axes()
+
+        for series in self._series.values():
+            series._trim(self.x_min)
+
+        if self.autoscale:
+            self._autoscale()
+
+        for series in self._series.values():
+            series.redraw()
+
+    def plot_line(
+        self,
+        points: list = None,
+        color="black",
+        point_visibility=False,
+        name: str = None,
+        decimation: str = "minmax",
+        x=None,
+        y=None,
+    ):
+        """
+        Plot a line of points.  The line is drawn as a single polyline \
+        (split into chunks of ``Series.chunk_size`` points for very long \
+        lines) rather than one canvas item per segment.
+
+        The points may be given either as a list of (x, y) tuples or as \
+        separate ``x`` and ``y`` sequences such as NumPy arrays or \
+        ``array.array('d')`` buffers, which are drawn without being \
+        converted to tuples (see :meth:`Series.set_data`).  A NumPy \
+        array of shape (n, 2) is treated as separate x and y columns.::
+
+            graph.plot_line(x=numpy.linspace(0, 1, 100000), y=samples)
+
+        :param points: a list of tuples, each tuple containing an (x, y) point
+        :param color: the color of the line
+        :param point_visibility: True if the points \
+        should be individually visible
+        :param name: an optional name for the series; a name is \
+        generated if none is supplied
+        :param decimation: the decimation method, see :class:`Series`
+        :param x: the x values, as an alternative to points
+        :param y: the y values, as an alternative to points
+        :return: the :class:`Series` that was drawn
+        """
+        if np is not None and isinstance(points, np.ndarray) and points.ndim == 2:
+            x, y = points[:, 0], points[:, 1]
+
+        series = self.add_series(name, color=color, decimation=decimation)
+        if x is not None and y is not None:
+            series.set_data(x, y)
+        else:
+            series.extend(points)
+
+        if point_visibility:
+            coords = self._to_canvas(series.points)
+            for coord in zip(coords[0::2], coords[1::2]):
+                self._draw_marker(
+                    coord, color, 5, tags=self._tags("series", "marker") + (series.tag,)
+                )
+            self._raise_axes()
+
+        return series
+
+    def plot_scatter(
+        self,
+        points: list = None,
+        color="black",
+        name: str = None,
+        density: bool = False,
+        x=None,
+        y=None,
+    ):
+        """
+        Plot a dense scatter of points as a single image rather than \
+        one canvas item per point.::
+
+            graph.plot_scatter(x=xs, y=ys, color="blue", density=True)
+
+        :param points: a list of tuples, each tuple containing an (x, y) point
+        :param color: the color of the points
+        :param name: an optional name for the series; a name is \
+        generated if none is supplied
+        :param density: True to shade each pixel by the number of \
+        points which fall within it
+        :param x: the x values, as an alternative to points
+        :param y: the y values, as an alternative to points
+        :return: the :class:`ScatterSeries` that was drawn
+        """
+        if np is not None and isinstance(points, np.ndarray) and points.ndim == 2:
+            x, y = points[:, 0], points[:, 1]
+
+        series = ScatterSeries(
+            self, self._series_name(name), color=color, density=density
+        )
+        self._series[series.name] = series
+
+        if x is not None and y is not None:
+            series.set_data(x, y)
+        else:
+            series.extend(points)
+
+        return series
+
+    def plot_file(
+        self,
+        path: str,
+        dtype: str = "float64",
+        x_path: str = None,
+        offset: int = 0,
+        color="black",
+        name: str = None,
+    ):
+        """
+        Plot a line from raw binary files, which are memory-mapped so \
+        that files much larger than memory may be browsed with \
+        :meth:`set_xlim` and :meth:`pan`.  Only the visible window of \
+        the files is read.::
+
+            graph.plot_file("capture.bin", dtype="float32")
+            graph.plot_file("y.f64", x_path="x.f64")
+
+        :param path: a file of interleaved x and y values, or of y \
+        values only when ``x_path`` is given
+        :param dtype: the type of the values, see :meth:`Series.map_file`
+        :param x_path: a file holding the x values, in ascending order
+        :param offset: the number of bytes before the first value of \
+        each file
+        :param color: the color of the line
+        :param name: an optional name for the series; a name is \
+        generated if none is supplied
+        :return: the :class:`Series` that was drawn
+        """
+        series = self.add_series(name, color=color)
+        series.map_file(path, dtype=dtype, x_path=x_path, offset=offset)
+
+        return series
+
+    def load_csv(
+        self,
+        path: str,
+        x_column: int = 0,
+        y_column: int = 1,
+        delimiter: str = ",",
+        skip_rows: int = 0,
+        color="black",
+        name: str = None,
+        chunk_size: int = 10000,
+        progress: callable = None,
+        done: callable = None,
+    ):
+        """
+        Plot a line from a CSV file, which is parsed in a worker thread \
+        and drawn progressively as it loads.::
+
+            loader = graph.load_csv("log.csv", skip_rows=1, progress=print)
+
+        :param path: the path of the file
+        :param x_column: the index of the column holding x values
+        :param y_column: the index of the column holding y values
+        :param delimiter: the character separating the columns
+        :param skip_rows: the number of header rows to skip
+        :param color: the color of the line
+        :param name: an optional name for the series; a name is \
+        generated if none is supplied
+        :param chunk_size: the number of rows parsed at a time
+        :param progress: a function called with the fraction loaded, \
+        see :class:`SeriesLoader`
+        :param done: a function called with the loader once loading \
+        finishes or is cancelled
+        :return: the :class:`SeriesLoader`, whose ``series`` is the \
+        :class:`Series` being loaded
+        """
+        series = self.add_series(name, color=color)
+        read = partial(
+            _read_csv,
+            x_column=x_column,
+            y_column=y_column,
+            delimiter=delimiter,
+            skip_rows=skip_rows,
+            chunk_size=chunk_size,
+        )
+
+        return SeriesLoader(series, path, read, progress=progress, done=done)
+
+    def load_binary(
+        self,
+        path: str,
+        dtype: str = "float64",
+        color="black",
+        name: str = None,
+        chunk_size: int = 100000,
+        progress: callable = None,
+        done: callable = None,
+    ):
+        """
+        Plot a line from a binary file of interleaved x and y values, \
+        which is read in a worker thread and drawn progressively as it \
+        loads.  Use :meth:`plot_file` instead to browse files too large \
+        to be loaded into memory.
+
+        :param path: the path of the file
+        :param dtype: the type of the values, see :meth:`Series.map_file`
+        :param color: the color of the line
+        :param name: an optional name for the series; a name is \
+        generated if none is supplied
+        :param chunk_size: the number of points read at a time
+        :param progress: a function called with the fraction loaded, \
+        see :class:`SeriesLoader`
+        :param done: a function called with the loader once loading \
+        finishes or is cancelled
+        :return: the :class:`SeriesLoader`, whose ``series`` is the \
+        :class:`Series` being loaded
+        """
+        series = self.add_series(name, color=color)
+        read = partial(_read_binary, dtype=dtype, chunk_size=chunk_size)
+
+        return SeriesLoader(series, path, read, progress=progress, done=done)
+
+    @staticmethod
+    def frange(start, stop, step, digits_to_round=3):
+        """
+        Works like range for doubles
+
+        :param start: starting value
+        :param stop: ending value
+        :param step: the increment_value
+        :param digits_to_round: the digits to which to round \
+        (makes floating-point numbers much easier to work with)
+        :return: generator
+        """
+        while start < stop:
+            yield round(start, digits_to_round)
+            start += step
+
+
+class _GraphPanel(Graph):
+    """
+    One panel of a :class:`MultiGraph`: a :class:`Graph` drawn within \
+    a horizontal band of the canvas that it shares with the other \
+    panels.  Changes to the x range are passed to the owning \
+    :class:`MultiGraph` so that all panels stay aligned.
+
+    :param owner: the :class:`MultiGraph` which owns the panel
+    :param index: the position of the panel, counting from the top
+    :param count: the number of panels
+    """
+
+    def __init__(
+        self,
+        owner,
+        index: int,
+        count: int,
+        x_min: float,
+        x_max: float,
+        y_min: float,
+        y_max: float,
+        x_tick: float,
+        y_tick: float,
+    ):
+        self._owner = owner
+        self._index = index
+        self._count = count
+        self._prefix = "panel{}.".format(index)
+        self._x_labels = index == count - 1
+
+        super().__init__(owner, x_min, x_max, y_min, y_max, x_tick, y_tick)
+
+    def _create_canvas(self):
+        return self._owner.canvas
+
+    def _layout(self):
+        top, bottom = 20, self.h - 40
+        spacing = self._owner.spacing
+        height = (bottom - top - spacing * (self._count - 1)) / self._count
+        y0 = top + self._index * (height + spacing)
+
+        return 50, y0, self.w - 50, y0 + height
+
+    def _band(self):
+        # the spacing between panels is split between them
+        half = self._owner.spacing / 2
+        top = 0 if self._index == 0 else self._y0 - half
+        bottom = self.h if self._index == self._count - 1 else self._y1 + half
+
+        return 0, top, self.w, bottom
+
+    def set_xlim(self, x_min: float, x_max: float, x_tick: float = None):
+        self._owner.set_xlim(x_min, x_max, x_tick)
+
+    def pan(self, dx: float = 0.0, dy: float = 0.0):
+        if dx:
+            self._owner.pan(dx)
+        if dy:
+            self.set_ylim(self.y_min + dy, self.y_max + dy)
+
+
+class MultiGraph(tk.Frame):
+    """
+    Several graphs stacked on a single canvas, sharing one x-axis.::
+
+        graphs = tk_tools.MultiGraph(
+            parent=root,
+            x_min=0.0,
+            x_max=10.0,
+            x_tick=1.0,
+            panels=[(-1.0, 1.0, 0.5), (0.0, 100.0, 25.0)],
+            width=600,
+            height=400
+        )
+        graphs.grid(row=0, column=0)
+
+        graphs.panels[0].plot_line([(0, 0), (5, 1)])
+        graphs.panels[1].plot_line([(0, 50), (5, 75)])
+
+        graphs.set_xlim(2.0, 4.0)
+
+    Each of ``panels`` supports the plotting methods of :class:`Graph`. \
+    Only the bottom panel labels the x-axis.  Changing the x range \
+    moves and scales the series of every panel in one pass over the \
+    canvas, and the tick layout is computed once for all panels.
+
+    :param parent: the parent frame
+    :param x_min: the x minimum
+    :param x_max: the x maximum
+    :param x_tick: the 'tick' on the x-axis
+    :param panels: a list of (y_min, y_max, y_tick) tuples, one for \
+    each panel from top to bottom
+    :param width: the canvas width in pixels
+    :param height: the canvas height in pixels; 150 pixels per panel \
+    if None
+    :param spacing: the space between panels in pixels
+    :param options: the frame options
+    """
+
+    def __init__(
+        self,
+        parent,
+        x_min: float,
+        x_max: float,
+        x_tick: float,
+        panels: list,
+        width: int = 500,
+        height: int = None,
+        spacing: int = 10,
+        **options
+    ):
+        self._parent = parent
+        super().__init__(self._parent, **options)
+
+        if not panels:
+            raise ValueError("at least one panel is required")
+        if height is None:
+            height = 60 + 150 * len(panels)
+
+        self.spacing = spacing
+        self.canvas = tk.Canvas(self, width=width, height=height)
+        self.canvas.grid(row=0, column=0)
+
+        self.panels = [
+            _GraphPanel(
+                self, i, len(panels), x_min, x_max, y_min, y_max, x_tick, y_tick
+            )
+            for i, (y_min, y_max, y_tick) in enumerate(panels)
+        ]
+
+    @property
+    def x_min(self):
+        return self.panels[0].x_min
+
+    @property
+    def x_max(self):
+        return self.panels[0].x_max
+
+    @property
+    def x_tick(self):
+        return self.panels[0].x_tick
+
+    def set_xlim(self, x_min: float, x_max: float, x_tick: float = None):
+        """
+        Changes the visible range of the shared x-axis of all panels
+
+        :param x_min: the x minimum
+        :param x_max: the x maximum
+        :param x_tick: the 'tick' on the x-axis; unchanged if None
+        :return: None
+        """
+        if x_max <= x_min:
+            raise ValueError("the maximum of each axis must exceed its minimum")
+
+        first = self.panels[0]
+        x_tick = x_tick or first.x_tick
+        x_scale = first.px_x / first.x_tick
+        old_x_min = first.x_min
+
+        for panel in self.panels:
+            panel.x_min, panel.x_max, panel.x_tick = x_min, x_max, x_tick
+            panel._update_axes()
+
+        # the panels share their horizontal transform, so the series of
+        # all of them are moved and scaled by the same canvas calls
+        new_x_scale = first.px_x / first.x_tick
+        first._transform(
+            "", new_x_scale / x_scale, 1.0, (old_x_min - x_min) * new_x_scale, 0.0
+        )
+
+        for panel in self.panels:
+            panel._refresh_series(x_min, x_max)
+
+    def pan(self, dx: float):
+        """
+        Shifts the visible range of the shared x-axis of all panels
+
+        :param dx: the distance to shift the x-axis, in x units
+        :return: None
+        """
+        self.set_xlim(self.x_min + dx, self.x_max + dx)
+
+    def clear_series(self):
+        """
+        Removes all existing series from all panels
+
+        :return: None
+        """
+        for panel in self.panels:
+            panel.clear_series()
+
+
+def _bin_counts(samples, x_min: float, x_max: float, bins: int):
+    """
+    Counts the samples falling within each of ``bins`` equal bins \
+    between x_min and x_max.  Samples equal to x_max are counted in the \
+    last bin; samples outside of the range are ignored.
+
+    :param samples: a sequence of numbers
+    :param x_min: the lower edge of the first bin
+    :param x_max: the upper edge of the last bin
+    :param bins: the number of bins
+    :return: a list of counts
+    """
+    scale = bins / (x_max - x_min)
+
+    if np is not None:
+        samples = np.asarray(samples, dtype=float)
+        samples = samples[(samples >= x_min) & (samples <= x_max)]
+        indexes = ((samples - x_min) * scale).astype(int)
+        np.minimum(indexes, bins - 1, out=indexes)
+
+        return np.bincount(indexes, minlength=bins).tolist()
+
+    counts = [0] * bins
+    for sample in samples:
+        if x_min <= sample <= x_max:
+            counts[min(int((sample - x_min) * scale), bins - 1)] += 1
+
+    return counts
+
+
+class BarChart(Graph):
+    """
+    A bar chart drawn on a :class:`Graph`, with one bar for each of \
+    ``count`` equal intervals between x_min and x_max.::
+
+        bars = tk_tools.BarChart(root, count=8, y_min=0.0, y_max=100.0,
+                                 y_tick=20.0)
+        bars.grid()
+
+        bars.set_values([10, 20, 30, 40, 50, 60, 70, 80])
+
+    Each bar is a single rectangle which is created once and resized \
+    with ``canvas.coords`` when its value changes; bars whose value is \
+    unchanged are not touched.
+
+    :param parent: the parent frame
+    :param count: the number of bars
+    :param y_min: the y minimum
+    :param y_max: the y maximum
+    :param y_tick: the 'tick' on the y-axis
+    :param x_min: the left edge of the first bar
+    :param x_max: the right edge of the last bar; x_min + count if None
+    :param x_tick: the 'tick' on the x-axis; a tenth of the x range, \
+    or 1.0 for fewer than 10 bars, if None
+    :param color: the color of the bars
+    :param gap: the space between bars, as a fraction of the bar width
+    :param baseline: the value from which bars are drawn
+    :param options: additional valid tkinter.canvas options
+    """
+
+    def __init__(
+        self,
+        parent,
+        count: int,
+        y_min: float,
+        y_max: float,
+        y_tick: float,
+        x_min: float = 0.0,
+        x_max: float = None,
+        x_tick: float = None,
+        color: str = "blue",
+        gap: float = 0.1,
+        baseline: float = 0.0,
+        **options
+    ):
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        if x_max is None:
+            x_max = x_min + count
+        if x_tick is None:
+            x_tick = self._default_x_tick(x_min, x_max, count)
+
+        self.color = color
+        self.gap = gap
+        self.baseline = baseline
+        self.values = []
+        self._bars = []
+
+        super().__init__(parent, x_min, x_max, y_min, y_max, x_tick, y_tick, **options)
+
+        self._set_bins(x_min, x_max, count)
+
+    def _set_bins(self, x_min: float, x_max: float, count: int):
+        """
+        Lays the bars out between x_min and x_max, creating or deleting \
+        rectangles only if the number of bars changes.  All values are \
+        reset to the baseline.
+        """
+        canvas = self.canvas
+        width = (x_max - x_min) / count
+        self.edges = [x_min + i * width for i in range(count + 1)]
+
+        while len(self._bars) > count:
+            canvas.delete(self._bars.pop())
+        while len(self._bars) < count:
+            self._bars.append(
+                canvas.create_rectangle(
+                    0,
+                    0,
+                    0,
+                    0,
+                    fill=self.color,
+                    outline="",
+                    tags=self._tags("series", "line", "bar"),
+                )
+            )
+        self._raise_axes()
+
+        self.values = [self.baseline] * count
+        view = self._view()
+        for i in range(count):
+            self._draw_bar(i, view)
+
+    @staticmethod
+    def _default_x_tick(x_min: float, x_max: float, count: int):
+        return (x_max - x_min) / 10 if count >= 10 else 1.0
+
+    def _draw_bar(self, i: int, view: tuple):
+        """
+        Sets the rectangle of the i-th bar to its value
+
+        :param i: the index of the bar
+        :param view: the transform of the graph, see :meth:`Graph._view`
+        """
+        x_scale, x_offset, y_scale, y_offset = view
+        left, right = self.edges[i], self.edges[i + 1]
+        inset = (right - left) * self.gap / 2
+
+        self.canvas.coords(
+            self._bars[i],
+            x_offset + (left + inset) * x_scale,
+            y_offset - self.values[i] * y_scale,
+            x_offset + (right - inset) * x_scale,
+            y_offset - self.baseline * y_scale,
+        )
+
+    def set_values(self, values):
+        """
+        Sets the value of each bar, resizing only the bars whose value \
+        has changed
+
+        :param values: a sequence of one value per bar
+        :return: None
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.tolist()
+        if len(values) != len(self._bars):
+            raise ValueError("one value is required for each bar")
+
+        view = self._view()
+        previous, self.values = self.values, list(values)
+        for i, (old, new) in enumerate(zip(previous, self.values)):
+            if old != new:
+                self._draw_bar(i, view)
+
+    def clear_series(self):
+        """
+        Returns all bars to the baseline
+
+        :return: None
+        """
+        self.set_values([self.baseline] * len(self._bars))
+
+
+class Histogram(BarChart):
+    """
+    A live histogram of samples in ``bins`` equal bins between x_min \
+    and x_max.::
+
+        histogram = tk_tools.Histogram(root, bins=256, x_min=0.0,
+                                       x_max=256.0, y_max=1000.0)
+        histogram.grid()
+
+        histogram.set_data(pixels)
+        histogram.add_data(more_pixels)
+
+    Samples are binned in bulk (with NumPy when it is installed) and \
+    only the bars whose counts changed are redrawn.
+
+    :param parent: the parent frame
+    :param bins: the number of bins
+    :param x_min: the lower edge of the first bin
+    :param x_max: the upper edge of the last bin
+    :param y_max: the highest count shown
+    :param y_tick: the 'tick' on the y-axis; a tenth of y_max if None
+    :param x_tick: the 'tick' on the x-axis; see :class:`BarChart`
+    :param color: the color of the bars
+    :param options: additional valid tkinter.canvas options
+    """
+
+    def __init__(
+        self,
+        parent,
+        bins: int = 10,
+        x_min: float = 0.0,
+        x_max: float = 1.0,
+        y_max: float = 100.0,
+        y_tick: float = None,
+        x_tick: float = None,
+        color: str = "blue",
+        **options
+    ):
+        if x_max <= x_min:
+            raise ValueError("x_max must exceed x_min")
+
+        super().__init__(
+            parent,
+            bins,
+            0.0,
+            y_max,
+            y_tick or y_max / 10,
+            x_min=x_min,
+            x_max=x_max,
+            x_tick=x_tick,
+            color=color,
+            gap=0.0,
+            **options
+        )
+
+    @property
+    def counts(self):
+        return self.values
+
+    def set_data(self, samples):
+        """
+        Replaces the counts with those of the given samples
+
+        :param samples: a sequence of numbers, such as a NumPy array
+        :return: None
+        """
+        self.set_values(self._bin(samples))
+
+    def add_data(self, samples):
+        """
+        Adds the counts of the given samples to the current counts
+
+        :param samples: a sequence of numbers, such as a NumPy array
+        :return: None
+        """
+        counts = self._bin(samples)
+        self.set_values([a + b for a, b in zip(self.values, counts)])
+
+    def set_range(self, x_min: float, x_max: float, bins: int = None):
+        """
+        Changes the bin edges.  Since the samples are not kept, the \
+        counts are reset; nothing is done if the edges are unchanged.
+
+        :param x_min: the lower edge of the first bin
+        :param x_max: the upper edge of the last bin
+        :param bins: the number of bins; unchanged if None
+        :return: None
+        """
+        if x_max <= x_min:
+            raise ValueError("x_max must exceed x_min")
+
+        bins = bins or len(self._bars)
+        if (x_min, x_max, bins) == (self.x_min, self.x_max, len(self._bars)):
+            return
+
+        self.x_min, self.x_max = x_min, x_max
+        self.x_tick = self._default_x_tick(x_min, x_max, bins)
+        self._update_axes()
+        self._set_bins(x_min, x_max, bins)
+
+    def _bin(self, samples):
+        return _bin_counts(samples, self.edges[0], self.edges[-1], len(self._bars))
+
+
+class SpectrumAnalyzer(Graph):
+    """
+    A live spectrum analyzer built on :class:`Graph`.  Raw time-domain \
+    samples are cut into frames of ``fft_size`` samples, windowed and \
+    transformed in a worker thread, then averaged or peak-held across \
+    frames.  Every ``refresh_ms`` the latest finished spectrum replaces \
+    the previous trace in place; spectra finished in between are \
+    never drawn.  Requires NumPy.::
+
+        analyzer = tk_tools.SpectrumAnalyzer(root, sample_rate=48000,
+                                             fft_size=2048, mode='peak')
+        analyzer.grid()
+
+        analyzer.add_samples(samples)
+
+    :param parent: the parent frame
+    :param sample_rate: the sample rate of the input in Hz
+    :param fft_size: the number of samples in each frame
+    :param y_min: the lowest level shown, in dB
+    :param y_max: the highest level shown, in dB
+    :param x_tick: the 'tick' on the frequency axis; a tenth of the \
+    frequency range if None
+    :param y_tick: the 'tick' on the level axis
+    :param window: the window applied to each frame: 'hann', \
+    'hamming', 'blackman' or None for a rectangular window
+    :param mode: how frames are combined: 'average' (an exponential \
+    average over ``averages`` frames), 'peak' (peak hold) or None \
+    (the latest frame only)
+    :param averages: the number of frames averaged in 'average' mode
+    :param refresh_ms: the interval between updates of the trace
+    :param color: the color of the trace
+    :param options: additional valid tkinter.canvas options
+    """
+
+    windows = {
+        "hann": "hanning",
+        "hamming": "hamming",
+        "blackman": "blackman",
+    }
+    modes = ("average", "peak", None)
+
+    def __init__(
+        self,
+        parent,
+        sample_rate: float,
+        fft_size: int = 1024,
+        y_min: float = -120.0,
+        y_max: float = 0.0,
+        x_tick: float = None,
+        y_tick: float = 20.0,
+        window: str = "hann",
+        mode: str = "average",
+        averages: int = 4,
+        refresh_ms: int = 33,
+        color: str = "blue",
+        **options
+    ):
+        if np is None:
+            raise ImportError("SpectrumAnalyzer requires numpy")
+        if mode not in self.modes:
+            raise ValueError("mode must be one of {}".format(self.modes))
+        if window is not None and window not in self.windows:
+            raise ValueError("window must be one of {}".format(list(self.windows)))
+
+        # draw_axes creates the trace through clear_series
+        self._color = color
+
+        nyquist = sample_rate / 2
+        super().__init__(
+            parent,
+            0.0,
+            nyquist,
+            y_min,
+            y_max,
+            x_tick or nyquist / 10,
+            y_tick,
+            **options
+        )
+
+        self.sample_rate = sample_rate
+        self.fft_size = fft_size
+        self.mode = mode
+        self.averages = averages
+        self.frequencies = np.fft.rfftfreq(fft_size, 1.0 / sample_rate)
+
+        if window is None:
+            self._window = np.ones(fft_size)
+        else:
+            self._window = getattr(np, self.windows[window])(fft_size)
+        self._gain = 2.0 / self._window.sum()
+
+        self._pending = np.empty(0)
+        self._frames = queue.Queue(maxsize=8)
+        self._lock = threading.Lock()
+        self._latest = None
+        self._spectrum = None
+        self._reset = False
+
+        self._worker = threading.Thread(target=self._process, daemon=True)
+        self._worker.start()
+
+        self._refresh_ms = refresh_ms
+        self._poll_id = self.after(self._refresh_ms, self._poll)
+
+    def add_samples(self, samples):
+        """
+        Adds time-domain samples to the analyzer.  Each complete frame \
+        of ``fft_size`` samples is handed to the worker thread; if the \
+        worker falls behind, the oldest waiting frames are dropped.
+
+        :param samples: a sequence of samples
+        :return: None
+        """
+        pending = np.concatenate((self._pending, np.asarray(samples, dtype=float)))
+
+        frames = len(pending) // self.fft_size
+        for i in range(frames):
+            self._enqueue(pending[i * self.fft_size : (i + 1) * self.fft_size])
+
+        self._pending = pending[frames * self.fft_size :]
+
+    def reset(self):
+        """
+        Discards the averaged or peak-held spectrum
+
+        :return: None
+        """
+        self._reset = True
+
+    def _compute(self, frame):
+        """
+        Calculates the level of each frequency bin of a frame in dB
+
+        :param frame: an array of ``fft_size`` samples
+        :return: an array of levels in dB
+        """
+        magnitude = np.abs(np.fft.rfft(frame * self._window)) * self._gain
+
+        return 20.0 * np.log10(np.maximum(magnitude, 1e-12))
+
+    def _process(self):
+        """
+        The worker thread: transforms frames and combines the results \
+        until it is handed None
+        """
+        while True:
+            frame = self._frames.get()
+            if frame is None:
+                return
+
+            levels = self._compute(frame)
+            spectrum = self._spectrum
+
+            if self._reset or spectrum is None or self.mode is None:
+                self._reset = False
+                spectrum = levels
+            elif self.mode == "peak":
+                spectrum = np.maximum(spectrum, levels)
+            else:
+                spectrum = spectrum + (levels - spectrum) / self.averages
+
+            self._spectrum = spectrum
+            with self._lock:
+                self._latest = spectrum
+
+    def clear_series(self):
+        """
+        Removes all series, replacing the trace with an empty one which \
+        the next spectrum is drawn on
+
+        :return: None
+        """
+        super().clear_series()
+        self._trace = self.add_series("spectrum", color=self._color)
+
+    def _poll(self):
+        """
+        Draws the latest finished spectrum, if there is a new one
+        """
+        with self._lock:
+            latest, self._latest = self._latest, None
+
+        if latest is not None:
+            self._trace.set_data(self.frequencies, latest)
+
+        self._poll_id = self.after(self._refresh_ms, self._poll)
+
+    def destroy(self):
+        self.after_cancel(self._poll_id)
+
+        # None stops the worker
+        self._enqueue(None)
+
+        super().destroy()
+
+    def _enqueue(self, item):
+        """
+        Hands an item to the worker, dropping the oldest waiting item \
+        if the queue is full
+        """
+        while True:
+            try:
+                self._frames.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._frames.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+class Waterfall(tk.Frame):
+    """
+    A scrolling waterfall (spectrogram) display.  Each call to \
+    :meth:`add_row` draws one row of magnitudes at the top of the \
+    image, with older rows scrolling down and eventually dropping off \
+    the bottom.::
+
+        waterfall = tk_tools.Waterfall(root, bins=1024, rows=300,
+                                       min_value=-100.0, max_value=0.0)
+        waterfall.grid()
+
+        waterfall.add_row(spectrum_in_db)
+
+    Each bin is one pixel wide and each row one pixel high.  Values are \
+    mapped to colors through a lookup table computed once.  The image \
+    is a ring of rows: each new row overwrites the oldest one and the \
+    image is shown twice, one copy above the other, with both moved \
+    down by a row.  Only the new row is converted and written, so the \
+    cost of a row does not depend on the amount of history shown and \
+    memory use is fixed.
+
+    :param parent: the parent frame
+    :param bins: the number of values in each row
+    :param rows: the number of rows of history to show
+    :param min_value: the value shown with the first color of the colormap
+    :param max_value: the value shown with the last color of the colormap
+    :param colormap: a list of colors, from low to high, between which \
+    the lookup table is interpolated
+    :param options: the frame options
+    """
+
+    colormap = ["#000000", "#0000c0", "#c00000", "#ffff00", "#ffffff"]
+    levels = 256
+
+    def __init__(
+        self,
+        parent,
+        bins: int,
+        rows: int = 200,
+        min_value: float = 0.0,
+        max_value: float = 1.0,
+        colormap: list = None,
+        **options
+    ):
+        self._parent = parent
+        super().__init__(self._parent, **options)
+
+        self.bins = bins
+        self.rows = rows
+
+        self.canvas = tk.Canvas(
+            self, width=bins, height=rows, highlightthickness=0, borderwidth=0
+        )
+        self.canvas.grid(row=0, column=0)
+
+        # the newest row is at _head; older rows follow it, wrapping
+        # around from the bottom of the image to the top
+        self._image = tk.PhotoImage(master=self, width=bins, height=rows)
+        self._head = 0
+        self._items = [
+            self.canvas.create_image(0, y, image=self._image, anchor="nw")
+            for y in (0, rows)
+        ]
+
+        if colormap is not None:
+            self.colormap = colormap
+        self._lut = self._build_lut(self.colormap)
+        self.set_range(min_value, max_value)
+        self.clear()
+
+    def _build_lut(self, colormap: list):
+        """
+        Interpolates the colormap into a table of ``levels`` colors
+
+        :param colormap: a list of at least two colors
+        :return: a list of '#rrggbb' strings
+        """
+        stops = [tuple(c >> 8 for c in self.winfo_rgb(color)) for color in colormap]
+
+        lut = []
+        for level in range(self.levels):
+            position = level / (self.levels - 1) * (len(stops) - 1)
+            i = min(int(position), len(stops) - 2)
+            f = position - i
+            lut.append(
+                "#{:02x}{:02x}{:02x}".format(
+                    *(round(a + (b - a) * f) for a, b in zip(stops[i], stops[i + 1]))
+                )
+            )
+
+        return lut
+
+    def set_range(self, min_value: float, max_value: float):
+        """
+        Changes the values mapped to the ends of the colormap.  Rows \
+        already shown are not re-colored.
+
+        :param min_value: the value shown with the first color
+        :param max_value: the value shown with the last color
+        :return: None
+        """
+        if max_value <= min_value:
+            raise ValueError("max_value must be greater than min_value")
+
+        self.min_value = min_value
+        self.max_value = max_value
+        self._scale = (self.levels - 1) / (max_value - min_value)
+
+    def _row_data(self, magnitudes):
+        """
+        Converts one row of magnitudes into PhotoImage pixel data
+
+        :param magnitudes: a sequence of ``bins`` values
+        :return: the pixel data string for a single row
+        """
+        top = self.levels - 1
+        if np is not None:
+            indexes = (
+                np.asarray(magnitudes, dtype=float) - self.min_value
+            ) * self._scale
+            indexes = np.clip(np.nan_to_num(indexes), 0, top).astype(int).tolist()
+        else:
+            indexes = [
+                min(max(int((m - self.min_value) * self._scale), 0), top)
+                for m in magnitudes
+            ]
+
+        lut = self._lut
+        return "{" + " ".join([lut[i] for i in indexes]) + "}"
+
+    def add_row(self, magnitudes):
+        """
+        Adds a row of magnitudes at the top of the waterfall, scrolling \
+        the existing rows down by one
+
+        :param magnitudes: a sequence of ``bins`` values
+        :return: None
+        """
+        if len(magnitudes) != self.bins:
+            raise ValueError(
+                "expected {} values, got {}".format(self.bins, len(magnitudes))
+            )
+
+        # overwrite the oldest row, then show the image from it
+        self._head = (self._head - 1) % self.rows
+        self._image.put(self._row_data(magnitudes), to=(0, self._head))
+
+        self.canvas.coords(self._items[0], 0, -self._head)
+        self.canvas.coords(self._items[1], 0, self.rows - self._head)
+
+    def clear(self):
+        """
+        Fills the waterfall with the lowest color of the colormap
+
+        :return: None
+        """
+        self._image.put(self._lut[0], to=(0, 0, self.bins, self.rows))
+
+
+class Led(tk.Frame):
+    """
+    Create an LED-like interface for the user.::
+
+        led = tk_tools.Led(root, size=50)
+        led.pack()
+
+        led.to_red()
+        led.to_green(on=True)
+
+    The user also has the option of adding an `on_click_callback`
+    function.  When the button is clicked, the button will change
+    state and the on-click callback will be executed.  The
+    callback must accept a single boolean parameter, `on`, which
+    indicates if the LED was just turned on or off.
+
+    :param parent: the parent frame
+    :param size: the size in pixels
+    :param on_click_callback: a callback which accepts a boolean parameter 'on'
+    :param options: the frame options
+    """
+
+    def __init__(
         self,
         parent,
         size: int = 100,
@@ -633,6 +4588,7 @@ class Led(tk.Frame):
         self._canvas = tk.Canvas(self, **canvas_opts)
         self._canvas.grid(row=0)
         self._image = None
+        self._image_item = None
         self._on = False
         self._user_click_callback = on_click_callback
         self._toggle_on_click = toggle_on_click
@@ -652,12 +4608,14 @@ class Led(tk.Frame):
         :param img_data: the image data as a base64 string
         :return: None
         """
-        self._image = tk.PhotoImage(data=img_data)
-        self._image = self._image.subsample(
-            int(200 / self._size), int(200 / self._size)
-        )
-        self._canvas.delete("all")
-        self._canvas.create_image(0, 0, image=self._image, anchor="nw")
+        self._image = _ImageCache.of(self).get(img_data, int(200 / self._size))
+
+        if self._image_item is None:
+            self._image_item = self._canvas.create_image(
+                0, 0, image=self._image, anchor="nw"
+            )
+        else:
+            self._canvas.itemconfigure(self._image_item, image=self._image)
 
         if self._user_click_callback is not None:
             self._user_click_callback(self._on)